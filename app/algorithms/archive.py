@@ -0,0 +1,92 @@
+import numpy as np
+
+
+class ParetoArchive:
+    """Linear archive of points with dominance bookkeeping.
+
+    Every stored point keeps the number of stored points dominating it, so both
+    insertion and removal cost a single vectorized pass over the archive and the
+    front (points without dominators) never has to be recomputed. Out of equal
+    points the one inserted first dominates the others.
+    """
+
+    def __init__(self, dim: int, capacity: int = 64) -> None:
+        self.dim: int = dim
+        self._rows: np.ndarray = np.empty((capacity, dim))
+        self._ids: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self._dominators: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self._alive: np.ndarray = np.zeros(capacity, dtype=bool)
+        self._used: int = 0
+        self._slot_of: dict[int, int] = {}
+        self._next_id: int = 0
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, point_id: int) -> bool:
+        return point_id in self._slot_of
+
+    def insert(self, point: np.ndarray) -> int:
+        """Stores the point and returns its id."""
+        if self._used == len(self._ids):
+            self._grow()
+        rows = self._rows[: self._used]
+        alive = self._alive[: self._used]
+        dominating = np.all(rows <= point, axis=1) & alive
+        dominated = np.all(point <= rows, axis=1) & alive & ~dominating
+
+        slot = self._used
+        self._dominators[: self._used][dominated] += 1
+        self._rows[slot] = point
+        self._ids[slot] = self._next_id
+        self._dominators[slot] = np.count_nonzero(dominating)
+        self._alive[slot] = True
+        self._slot_of[self._next_id] = slot
+        self._used += 1
+        self._next_id += 1
+        return self._next_id - 1
+
+    def remove(self, point_id: int) -> None:
+        """Removes the point with the given id, promoting the points it alone dominated."""
+        slot = self._slot_of.pop(point_id)
+        self._alive[slot] = False
+        rows = self._rows[: self._used]
+        point = rows[slot]
+        # equal points inserted later were dominated by the removed one as well
+        dominated = (
+            np.all(point <= rows, axis=1)
+            & (np.any(point != rows, axis=1) | (self._ids[: self._used] > point_id))
+            & self._alive[: self._used]
+        )
+        self._dominators[: self._used][dominated] -= 1
+        if len(self) < self._used // 2:
+            self._compact()
+
+    def front(self) -> np.ndarray:
+        """Ids of the non-dominated points."""
+        used = slice(0, self._used)
+        return self._ids[used][self._alive[used] & (self._dominators[used] == 0)]
+
+    def is_non_dominated(self, point_ids: np.ndarray) -> np.ndarray:
+        slots = np.fromiter(
+            (self._slot_of[i] for i in point_ids), dtype=np.intp, count=len(point_ids)
+        )
+        return self._dominators[slots] == 0
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._ids)
+        for name in ("_rows", "_ids", "_dominators", "_alive"):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[: self._used] = array[: self._used]
+            setattr(self, name, grown)
+
+    def _compact(self) -> None:
+        alive = self._alive[: self._used].copy()
+        kept = np.count_nonzero(alive)
+        for name in ("_rows", "_ids", "_dominators", "_alive"):
+            array = getattr(self, name)
+            array[:kept] = array[: self._used][alive]
+        self._alive[kept : self._used] = False
+        self._used = kept
+        self._slot_of = {int(point_id): slot for slot, point_id in enumerate(self._ids[:kept])}
@@ -0,0 +1,164 @@
+from typing import BinaryIO, Iterable, Iterator, TextIO
+import tempfile
+import numpy as np
+import pandas as pd
+
+DEFAULT_MEMORY_LIMIT: int = 64 * 2**20
+SPILL_CHUNK_SIZE: int = 4096
+
+
+def read_csv_chunks(
+    file: str | TextIO, chunksize: int = 100_000, signs: np.ndarray | None = None
+) -> Iterator[np.ndarray]:
+    """Streams a CSV dataset (in CSVDatasetLoader layout) as arrays of rows."""
+    for chunk in pd.read_csv(file, index_col=0, chunksize=chunksize):
+        rows = chunk.to_numpy(dtype=float)
+        yield rows if signs is None else rows * signs
+
+
+class _Window:
+    """Fixed size in-memory window of BNL candidates."""
+
+    def __init__(self, capacity: int, dim: int) -> None:
+        self.rows = np.empty((capacity, dim))
+        self.indices = np.empty(capacity, dtype=np.int64)
+        # number of rows spilled in the pass before the candidate entered the window
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        # candidates inserted during the previous pass
+        self.carried = np.empty(capacity, dtype=bool)
+        self.size = 0
+
+    def is_full(self) -> bool:
+        return self.size == len(self.indices)
+
+    def is_dominated(self, row: np.ndarray) -> bool:
+        return bool(np.any(np.all(self.rows[: self.size] <= row, axis=1)))
+
+    def insert(self, index: int, row: np.ndarray, timestamp: int) -> None:
+        self.rows[self.size] = row
+        self.indices[self.size] = index
+        self.timestamps[self.size] = timestamp
+        self.carried[self.size] = False
+        self.size += 1
+
+    def keep(self, mask: np.ndarray) -> None:
+        kept = int(mask.sum())
+        for array in (self.rows, self.indices, self.timestamps, self.carried):
+            array[:kept] = array[: self.size][mask]
+        self.size = kept
+
+    def remove_dominated_by(self, row: np.ndarray) -> None:
+        dominated = np.all(row <= self.rows[: self.size], axis=1)
+        if dominated.any():
+            self.keep(~dominated)
+
+    def next_confirmation(self) -> int:
+        """Position in the pass input at which the oldest carried candidate is confirmed."""
+        carried = self.timestamps[: self.size][self.carried[: self.size]]
+        return int(carried.min()) if len(carried) else np.iinfo(np.int64).max
+
+    def pop(self, mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        popped = self.rows[: self.size][mask].copy(), self.indices[: self.size][mask].copy()
+        self.keep(~mask)
+        return popped
+
+
+def _spill_dtype(dim: int) -> np.dtype:
+    return np.dtype([("index", np.int64), ("row", np.float64, (dim,))])
+
+
+def _read_spill(file: BinaryIO, dtype: np.dtype) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    file.seek(0)
+    while True:
+        records = np.fromfile(file, dtype=dtype, count=SPILL_CHUNK_SIZE)
+        if len(records) == 0:
+            return
+        yield records["index"], records["row"]
+
+
+def _index_chunks(chunks: Iterable[np.ndarray]) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    offset = 0
+    for chunk in chunks:
+        rows = np.atleast_2d(np.asarray(chunk, dtype=float))
+        yield np.arange(offset, offset + len(rows)), rows
+        offset += len(rows)
+
+
+def _prepend(first, rest: Iterator) -> Iterator:
+    yield first
+    yield from rest
+
+
+def _collect(popped: tuple[np.ndarray, np.ndarray], rows: list, indices: list) -> None:
+    rows.append(popped[0])
+    indices.append(popped[1])
+
+
+def block_nested_loops(
+    chunks: Iterable[np.ndarray], memory_limit: int = DEFAULT_MEMORY_LIMIT
+) -> tuple[np.ndarray, np.ndarray]:
+    """Block-Nested-Loops skyline over a stream of row chunks.
+
+    At most memory_limit bytes of candidates are held in the window, rows which
+    don't fit are spilled to a temporary file and processed in further passes.
+    Returns the non-dominated rows and their positions in the stream.
+    Reference: https://doi.org/10.1109/ICDE.2001.914855
+    """
+    source = _index_chunks(chunks)
+    first = next(source, None)
+    if first is None:
+        return np.empty((0, 0)), np.empty(0, dtype=np.int64)
+    dim = first[1].shape[1]
+    dtype = _spill_dtype(dim)
+    capacity = memory_limit // (dtype.itemsize + np.dtype(np.int64).itemsize + 1)
+    if capacity < 1:
+        raise ValueError("The memory limit doesn't fit a single candidate.")
+
+    window = _Window(capacity, dim)
+    front_rows, front_indices = [], []
+    pass_input = _prepend(first, source)
+    spill_file = None
+    while pass_input is not None:
+        output_file = tempfile.TemporaryFile()
+        buffer = np.empty(SPILL_CHUNK_SIZE, dtype=dtype)
+        buffered, spilled, position = 0, 0, 0
+        next_confirmation = window.next_confirmation()
+        for indices, rows in pass_input:
+            for index, row in zip(indices, rows):
+                if position >= next_confirmation:
+                    # carried candidates were already compared with every row from here on
+                    confirmed = window.carried[: window.size] & (
+                        window.timestamps[: window.size] <= position
+                    )
+                    _collect(window.pop(confirmed), front_rows, front_indices)
+                    next_confirmation = window.next_confirmation()
+                position += 1
+                if window.is_dominated(row):
+                    continue
+                window.remove_dominated_by(row)
+                if not window.is_full():
+                    window.insert(index, row, spilled)
+                    continue
+                buffer[buffered] = (index, row)
+                buffered += 1
+                spilled += 1
+                if buffered == SPILL_CHUNK_SIZE:
+                    buffer.tofile(output_file)
+                    buffered = 0
+        buffer[:buffered].tofile(output_file)
+        output_file.flush()
+
+        _collect(window.pop(window.carried[: window.size].copy()), front_rows, front_indices)
+        # candidates inserted before anything was spilled saw the whole pass
+        _collect(window.pop(window.timestamps[: window.size] == 0), front_rows, front_indices)
+        window.carried[: window.size] = True
+
+        if spill_file is not None:
+            spill_file.close()
+        spill_file = output_file
+        pass_input = _read_spill(spill_file, dtype) if spilled else None
+    spill_file.close()
+
+    rows, indices = np.concatenate(front_rows), np.concatenate(front_indices)
+    order = np.argsort(indices)
+    return rows[order], indices[order]
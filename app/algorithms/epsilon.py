@@ -0,0 +1,49 @@
+from typing import Sequence
+import numpy as np
+from .point_set import PointSet
+from .filtered import block_naive_with_filtering
+
+
+def epsilon_steps(
+    data: np.ndarray, epsilon: float | Sequence[float], relative: bool = False
+) -> np.ndarray:
+    """Per criterion box sizes, a relative epsilon is a fraction of the criterion's range."""
+    epsilon = np.broadcast_to(np.asarray(epsilon, dtype=float), (data.shape[1],))
+    if np.any(epsilon <= 0):
+        raise ValueError("Epsilon has to be positive for every criterion.")
+    if relative:
+        return epsilon * np.ptp(data, axis=0)
+    return epsilon
+
+
+def epsilon_front(
+    points: PointSet, epsilon: float | Sequence[float] = 0.01, relative: bool = True
+) -> np.ndarray:
+    """Approximate front under epsilon-dominance, returns indices of the chosen rows.
+
+    Rows are put into a grid of epsilon sized boxes, every box is represented by
+    its row closest to the box corner and only non-dominated boxes are kept. Every
+    input row x is then epsilon-dominated by some returned row r, i.e.
+    r - epsilon <= x on every criterion, while the result holds at most one row per box.
+    Reference: https://doi.org/10.1162/106365602760234108
+    """
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+    data = points.data
+    steps = epsilon_steps(data, epsilon, relative)
+    # constant criteria (zero range) all fall into a single box
+    safe_steps = np.where(steps > 0, steps, 1.0)
+    offsets = (data - data.min(axis=0)) / safe_steps
+    boxes = np.floor(offsets)
+    boxes[:, steps == 0] = 0
+
+    unique_boxes, inverse = np.unique(boxes, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    # the point closest to the box corner is non-dominated within its box
+    order = np.lexsort(((offsets - boxes).sum(axis=1), inverse))
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = inverse[order[1:]] != inverse[order[:-1]]
+    representatives = order[is_first]
+
+    non_dominated_boxes = block_naive_with_filtering(PointSet(unique_boxes))
+    return np.sort(representatives[non_dominated_boxes])
@@ -1,6 +1,7 @@
 from typing import Any, List
-from numpy import ones, ndarray, argmax
+from numpy import ones, ndarray, argmax, array, intp
 from .point import Point
+from .point_set import PointSet, DEFAULT_BLOCK_SIZE
 
 
 def naive_with_filtering(
@@ -33,3 +34,36 @@ def naive_with_filtering(
             non_dominated_results.append(data[argmax(active)])
             break
     return non_dominated_results
+
+
+def block_naive_with_filtering(
+    points: PointSet, block_size: int = DEFAULT_BLOCK_SIZE
+) -> ndarray:
+    """Block-vectorized naive algorithm with filtering, returns indices of non-dominated rows."""
+    n: int = len(points)
+    active: ndarray = ones(n, dtype=bool)
+    non_dominated_results: List[int] = []
+    for i in range(n):
+        if not active[i]:
+            continue
+        candidate = i
+        start = i + 1
+        while start < n:
+            stop = min(start + block_size, n)
+            block_active = active[start:stop]
+            dominated = points.dominated_by(candidate, start, stop) & block_active
+            dominating = points.dominating(candidate, start, stop) & block_active & ~dominated
+            if dominating.any():
+                # rows before the new candidate were only compared with the old one
+                k = int(argmax(dominating))
+                block_active[:k] &= ~dominated[:k]
+                active[candidate] = False
+                candidate = start + k
+                start = candidate + 1
+                continue
+            block_active &= ~dominated
+            start = stop
+        non_dominated_results.append(candidate)
+        points.filter_dominated(candidate, active, block_size)
+        active[candidate] = False
+    return array(non_dominated_results, dtype=intp)
@@ -1,6 +1,7 @@
 from typing import Iterable
 import numpy as np
 from .point import Point
+from .point_set import PointSet, DEFAULT_BLOCK_SIZE
 
 
 def distance_between_points(p1: Point, p2: Point):
@@ -26,7 +27,7 @@ def ideal_point_method(points: Iterable[Point]) -> list[Point]:
     non_dominated_points = []
     is_point_active = [True] * total_points
 
-    while current_index <= total_points:
+    while current_index < total_points:
         if not is_point_active[sorted_indices[current_index]]:
             current_index += 1
             continue
@@ -37,7 +38,27 @@ def ideal_point_method(points: Iterable[Point]) -> list[Point]:
         is_point_active[sorted_indices[current_index]] = False
         non_dominated_points.append(points[sorted_indices[current_index]])
 
-        total_points -= 1
         current_index += 1
 
     return non_dominated_points
+
+
+def block_ideal_point_method(
+    points: PointSet, block_size: int = DEFAULT_BLOCK_SIZE
+) -> np.ndarray:
+    """Block-vectorized ideal point method, returns indices of non-dominated rows."""
+    ideal_point = points.data.min(axis=0)
+    distances = np.square(points.data - ideal_point).sum(axis=1)
+    sorted_indices = np.argsort(distances, kind="stable")
+
+    is_point_active = np.ones(len(points), dtype=bool)
+    non_dominated_points = []
+    for idx in sorted_indices:
+        if not is_point_active[idx]:
+            continue
+        # the closest remaining point can not be dominated by any other one
+        non_dominated_points.append(idx)
+        points.filter_dominated(idx, is_point_active, block_size)
+        if not is_point_active.any():
+            break
+    return np.array(non_dominated_points, dtype=np.intp)
@@ -1,14 +1,35 @@
+import os
 import time
+import tracemalloc
+import zlib
+from collections import deque
+from dataclasses import asdict, dataclass
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Iterable, Iterator
 from numpy import mean, std
+from numpy.random import Generator, default_rng
 
-from .point import Point
-from .types import OWDAlgorithm, RankingMethod
-from .ideal_point import ideal_point_method
-from .filtered import naive_with_filtering
-from .naive_without_filtration import naive_without_filtering
-from .vikor import vikor
-from .topsis import topsis
-from .uta_star import uta_star
+from .point import ComparisonStats, Point, create_points_from_datapoints
+from .types import (
+    OWDAlgorithm,
+    VectorizedOWDAlgorithm,
+    RankingMethod,
+    BatchRankingMethod,
+    distribution_callable,
+)
+from .ideal_point import ideal_point_method, block_ideal_point_method
+from .filtered import naive_with_filtering, block_naive_with_filtering
+from .naive_without_filtration import (
+    naive_without_filtering,
+    block_naive_without_filtering,
+)
+from .kung import kung_method
+from .sfs import sort_filter_skyline
+from .epsilon import epsilon_front
+from .vikor import vikor, vikor_batch
+from .topsis import topsis, topsis_batch
+from .uta_star import uta_star, uta_star_batch
 from .rsm import reference_set_method
 
 
@@ -16,6 +37,22 @@ NAIVE_ALGORITHMS: dict[str, OWDAlgorithm] = {
     "ideal point method": ideal_point_method,
     "filtered naive": naive_with_filtering,
     "naive without filtration": naive_without_filtering,
+    "kung divide and conquer": kung_method,
+    "sort-filter skyline": sort_filter_skyline,
+}
+
+
+# array-backed counterparts of NAIVE_ALGORITHMS, keyed by the same names
+VECTORIZED_NAIVE_ALGORITHMS: dict[str, VectorizedOWDAlgorithm] = {
+    "ideal point method": block_ideal_point_method,
+    "filtered naive": block_naive_with_filtering,
+    "naive without filtration": block_naive_without_filtering,
+}
+
+
+# trade precision for speed, the result only approximates the front
+APPROXIMATE_NAIVE_ALGORITHMS: dict[str, VectorizedOWDAlgorithm] = {
+    "epsilon dominance": epsilon_front,
 }
 
 
@@ -27,6 +64,50 @@ RANKING_ALGORITHMS: dict[str, RankingMethod] = {
 }
 
 
+# counterparts of RANKING_ALGORITHMS evaluating a (k, d) matrix of weight vectors at once
+BATCH_RANKING_ALGORITHMS: dict[str, BatchRankingMethod] = {
+    "TOPSIS": topsis_batch,
+    "UTA Star": uta_star_batch,
+    "VIKOR": vikor_batch,
+}
+
+
+def _generator(rng: Generator | None) -> Generator:
+    return default_rng() if rng is None else rng
+
+
+def _anticorrelated(
+    dimensionality: int, cardinality: int, rng: Generator | None = None
+) -> list[Point]:
+    # points scattered around the hyperplane where the coordinates sum up to a constant
+    rng = _generator(rng)
+    offset = rng.normal(0.5, 0.05, size=(cardinality, 1))
+    spread = rng.uniform(-0.5, 0.5, size=(cardinality, dimensionality))
+    spread -= spread.mean(axis=1, keepdims=True)
+    return create_points_from_datapoints(offset + spread)
+
+
+DISTRIBUTIONS: dict[str, distribution_callable] = {
+    "uniform": lambda dimensionality, cardinality, rng=None: create_points_from_datapoints(
+        _generator(rng).uniform(0, 2, size=(cardinality, dimensionality))
+    ),
+    "normal": lambda dimensionality, cardinality, rng=None: create_points_from_datapoints(
+        _generator(rng).normal(1, 1, size=(cardinality, dimensionality))
+    ),
+    "exponential": lambda dimensionality, cardinality, rng=None: create_points_from_datapoints(
+        _generator(rng).exponential(1, size=(cardinality, dimensionality))
+    ),
+    "poisson": lambda dimensionality, cardinality, rng=None: create_points_from_datapoints(
+        _generator(rng).poisson(2, size=(cardinality, dimensionality))
+    ),
+    "anticorrelated": _anticorrelated,
+}
+
+
+# per repeat measurements of BenchmarkAnalyzer.run_algorithm with profile_memory
+MEMORY_SAMPLES: tuple[str, ...] = ("peak_memory", "retained_memory", "retained_allocations")
+
+
 class BenchmarkAnalyzer:
     def __init__(self, algorithm: str, dimensionality: int, dataset: list[Point]):
         self.algorithm = algorithm
@@ -38,24 +119,34 @@ class BenchmarkAnalyzer:
         self.comparison_coordinates_counter: list[int] = []
         self.recent_result: [dict[str, any] | None] = None
 
-    def run_algorithm(self, repeats: int) -> dict[str, any]:
+    def run_algorithm(self, repeats: int, profile_memory: bool = False) -> dict[str, any]:
+        """Measures repeats runs of the algorithm.
+
+        With profile_memory every repeat is followed by a separate run traced by
+        tracemalloc (tracing slows the run down, so it isn't timed), which reports
+        its peak memory and the bytes and blocks it allocated that are still alive
+        when it returns, the result included. tracemalloc only sees live blocks, so
+        allocations freed during the run are in the peak, but not in the totals.
+        """
         self.times = []
-        self.comparison_counter = []
+        self.comparison_point_counter = []
+        self.comparison_coordinates_counter = []
+        memory_samples = {key: [] for key in MEMORY_SAMPLES}
 
         for _ in range(repeats):
-            Point.reset_counter()
-
-            start = time.perf_counter()
+            with ComparisonStats() as stats:
+                start = time.perf_counter()
 
-            NAIVE_ALGORITHMS[self.algorithm](self.dataset)
+                NAIVE_ALGORITHMS[self.algorithm](self.dataset)
 
-            self.times.append(time.perf_counter() - start)
-            self.comparison_point_counter.append(Point.get_global_point_counter())
-            self.comparison_coordinates_counter.append(
-                Point.get_global_coordinate_counter()
-            )
+                self.times.append(time.perf_counter() - start)
+            self.comparison_point_counter.append(stats.point_comparisons)
+            self.comparison_coordinates_counter.append(stats.coordinate_comparisons)
+            if profile_memory:
+                for key, value in zip(MEMORY_SAMPLES, self._trace_memory()):
+                    memory_samples[key].append(value)
 
-        return {
+        self.recent_result = {
             "algorithm": self.algorithm,
             "dimensionality": self.dimensionality,
             "cardinality": self.cardinality,
@@ -63,11 +154,47 @@ class BenchmarkAnalyzer:
             "comparison_point_counter": self.comparison_point_counter,
             "comparison_coordinates_counter": self.comparison_coordinates_counter,
         }
+        if profile_memory:
+            self.recent_result.update(memory_samples)
+        return self.recent_result
+
+    def _trace_memory(self) -> tuple[int, int, int]:
+        """Peak bytes above the baseline, retained bytes and retained blocks of a single run.
+
+        Retained are the positive size and count differences between snapshots taken
+        before the run and while its result is still referenced.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+            result = NAIVE_ALGORITHMS[self.algorithm](self.dataset)
+
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            after = tracemalloc.take_snapshot()
+            del result
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        # snapshots are allocated while tracing, leave them out of the difference
+        own_traces = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = after.filter_traces(own_traces).compare_to(
+            before.filter_traces(own_traces), "traceback"
+        )
+        return (
+            peak,
+            sum(max(difference.size_diff, 0) for difference in differences),
+            sum(max(difference.count_diff, 0) for difference in differences),
+        )
 
     def parse_result(self, result: [dict[str, any] | None] = None) -> dict[str, any]:
         if result is None:
             result = self.recent_result
-        return {
+        parsed = {
             "algorithm": result["algorithm"],
             "dimensionality": result["dimensionality"],
             "cardinality": result["cardinality"],
@@ -81,3 +208,244 @@ class BenchmarkAnalyzer:
                 "std": std(result["comparison_coordinates_counter"]),
             },
         }
+        for key in MEMORY_SAMPLES:
+            if key in result:
+                parsed[key] = {"mean": mean(result[key]), "std": std(result[key])}
+        return parsed
+
+
+# per repeat measurements of BenchmarkAnalyzer.run_algorithm
+BENCHMARK_SAMPLES: tuple[str, ...] = (
+    "times",
+    "comparison_point_counter",
+    "comparison_coordinates_counter",
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkConfiguration:
+    """A single cell of the benchmark grid."""
+
+    distribution: str
+    dimensionality: int
+    cardinality: int
+    sorted: bool
+    algorithm: str
+    repeats: int = 1
+    seed: int = 0
+    warmup: int = 1
+    profile_memory: bool = False
+
+    def datasets(self) -> list[list[Point]]:
+        """Seeded datasets, one per repeat.
+
+        The seed depends only on the distribution, dimensionality and cardinality, so
+        every algorithm and presort flag of the grid is measured on the same data.
+        """
+        key = f"{self.distribution}/{self.dimensionality}/{self.cardinality}"
+        rng = default_rng([self.seed, zlib.crc32(key.encode())])
+        datasets = [
+            DISTRIBUTIONS[self.distribution](self.dimensionality, self.cardinality, rng)
+            for _ in range(self.repeats)
+        ]
+        if self.sorted:
+            datasets = [
+                sorted(dataset, key=lambda point: point.x[0]) for dataset in datasets
+            ]
+        return datasets
+
+    def run(self) -> dict[str, any]:
+        """Benchmarks the algorithm once per dataset, returns the per repeat samples.
+
+        The first dataset is processed warmup times beforehand, outside of the stats.
+        """
+        result = asdict(self)
+        samples = BENCHMARK_SAMPLES + (MEMORY_SAMPLES if self.profile_memory else ())
+        for key in samples:
+            result[key] = []
+        datasets = self.datasets()
+        for _ in range(self.warmup if datasets else 0):
+            NAIVE_ALGORITHMS[self.algorithm](datasets[0])
+        for dataset in datasets:
+            benchmark = BenchmarkAnalyzer(self.algorithm, self.dimensionality, dataset)
+            sample = benchmark.run_algorithm(1, self.profile_memory)
+            for key in samples:
+                result[key] += sample[key]
+        return result
+
+
+def benchmark_grid(
+    distributions: list[str],
+    dimensionalities: list[int],
+    cardinalities: list[int],
+    sorted_flags: list[bool],
+    algorithms: list[str],
+    repeats: int = 1,
+    seed: int = 0,
+    warmup: int = 1,
+    profile_memory: bool = False,
+) -> list[BenchmarkConfiguration]:
+    """Cartesian product of the parameters, in the order of benchmark.csv."""
+    return [
+        BenchmarkConfiguration(
+            distribution,
+            dimensionality,
+            cardinality,
+            is_sorted,
+            algorithm,
+            repeats,
+            seed,
+            warmup,
+            profile_memory,
+        )
+        for distribution in distributions
+        for cardinality in cardinalities
+        for dimensionality in dimensionalities
+        for is_sorted in sorted_flags
+        for algorithm in algorithms
+    ]
+
+
+def _run_in_worker(
+    configuration: BenchmarkConfiguration, connection: Connection
+) -> None:
+    try:
+        result = configuration.run()
+        result["status"] = "ok"
+    except Exception as error:
+        result = {**asdict(configuration), "status": "error", "error": repr(error)}
+    connection.send(result)
+    connection.close()
+
+
+def run_grid(
+    configurations: Iterable[BenchmarkConfiguration],
+    workers: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[dict[str, any]]:
+    """Runs every configuration in a separate process and yields results as they complete.
+
+    At most workers configurations run at once. A configuration running longer than
+    timeout seconds is killed and yielded with status "timeout", one which raised
+    with status "error", finished ones with status "ok".
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = deque(configurations)
+    running: dict[Connection, tuple[Process, BenchmarkConfiguration, float]] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                configuration = pending.popleft()
+                reader, writer = Pipe(duplex=False)
+                process = Process(
+                    target=_run_in_worker, args=(configuration, writer), daemon=True
+                )
+                process.start()
+                writer.close()
+                deadline = (
+                    float("inf") if timeout is None else time.monotonic() + timeout
+                )
+                running[reader] = (process, configuration, deadline)
+
+            nearest_deadline = min(deadline for _, _, deadline in running.values())
+            if nearest_deadline == float("inf"):
+                ready = wait(list(running))
+            else:
+                ready = wait(list(running), max(nearest_deadline - time.monotonic(), 0))
+            for reader in ready:
+                process, configuration, _ = running.pop(reader)
+                try:
+                    result = reader.recv()
+                except EOFError:
+                    result = {
+                        **asdict(configuration),
+                        "status": "error",
+                        "error": "The worker process died.",
+                    }
+                reader.close()
+                process.join()
+                yield result
+
+            now = time.monotonic()
+            for reader, (process, configuration, deadline) in list(running.items()):
+                if deadline <= now:
+                    process.kill()
+                    process.join()
+                    reader.close()
+                    del running[reader]
+                    yield {**asdict(configuration), "status": "timeout"}
+    finally:
+        for reader, (process, _, _) in running.items():
+            process.kill()
+            process.join()
+            reader.close()
+
+
+def sweep_cardinalities(
+    algorithms: list[str],
+    distribution: str,
+    dimensionality: int,
+    cardinalities: list[int],
+    measure: Callable[[str, list[Point]], tuple[dict[str, any], float]],
+    time_budget: float,
+    rng: Generator | None = None,
+) -> list[dict[str, any]]:
+    """Results of measure(algorithm, dataset) over growing datasets.
+
+    measure returns a result and its mean time in seconds. An algorithm is dropped
+    from larger cardinalities once that time exceeds the time budget, so quadratic
+    methods don't stall the sweep.
+    """
+    results = []
+    remaining = list(algorithms)
+    for cardinality in cardinalities:
+        if not remaining:
+            break
+        dataset = DISTRIBUTIONS[distribution](dimensionality, cardinality, rng)
+        for algorithm in list(remaining):
+            result, seconds = measure(algorithm, dataset)
+            results.append(result)
+            if seconds > time_budget:
+                remaining.remove(algorithm)
+    return results
+
+
+def cardinality_sweep(
+    algorithms: list[str],
+    distribution: str = "anticorrelated",
+    dimensionality: int = 3,
+    cardinalities: list[int] = [10**k for k in range(2, 7)],
+    repeats: int = 1,
+    time_budget: float = 60.0,
+) -> list[dict[str, any]]:
+    """Benchmarks the algorithms over growing datasets, see sweep_cardinalities."""
+
+    def measure(algorithm: str, dataset: list[Point]) -> tuple[dict[str, any], float]:
+        benchmark = BenchmarkAnalyzer(algorithm, dimensionality, dataset)
+        benchmark.run_algorithm(repeats)
+        result = benchmark.parse_result()
+        result["distribution"] = distribution
+        return result, result["mean_time"]["mean"]
+
+    return sweep_cardinalities(
+        algorithms, distribution, dimensionality, cardinalities, measure, time_budget
+    )
+
+
+def crossover_cardinality(
+    results: list[dict[str, any]], algorithm: str, baseline: str
+) -> int | None:
+    """Smallest swept cardinality at which the algorithm is faster than the baseline.
+
+    Cardinalities the baseline didn't finish within the time budget count as won.
+    """
+    times = {}
+    for result in results:
+        times[(result["algorithm"], result["cardinality"])] = result["mean_time"]["mean"]
+    for (name, cardinality), elapsed in sorted(times.items(), key=lambda item: item[0][1]):
+        if name != algorithm:
+            continue
+        baseline_time = times.get((baseline, cardinality))
+        if baseline_time is None or elapsed < baseline_time:
+            return cardinality
+    return None
@@ -0,0 +1,99 @@
+import numpy as np
+from .point import Point
+
+# below this many (top, bottom) pairs the rows are compared directly
+_BRUTE_FORCE_PAIRS: int = 64
+
+
+def _staircase_filter(
+    top: np.ndarray, bottom: np.ndarray, points: list[Point], coords: np.ndarray, k: int
+) -> np.ndarray:
+    """_filter on the last two criteria, k and k + 1, in O((t + b) log t).
+
+    Every bottom row is compared only with the top row of the smallest k + 1 value
+    among those not worse on k.
+    """
+    order = top[np.lexsort((coords[top, k + 1], coords[top, k]))]
+    z = coords[order, k + 1]
+    best_z = np.minimum.accumulate(z)
+    # position of the row holding the minimum of every prefix
+    best = order[np.maximum.accumulate(np.where(z == best_z, np.arange(len(z)), 0))]
+    positions = np.searchsorted(coords[order, k], coords[bottom, k], side="right") - 1
+    return np.array(
+        [
+            position >= 0 and points[best[position]] <= points[b]
+            for b, position in zip(bottom.tolist(), positions.tolist())
+        ],
+        dtype=bool,
+    )
+
+
+def _filter(
+    top: np.ndarray, bottom: np.ndarray, points: list[Point], coords: np.ndarray, k: int
+) -> np.ndarray:
+    """Mask of the bottom rows weakly dominated by some top row.
+
+    Every top row is known to be not worse than every bottom row on the criteria
+    before k, so only the criteria from k on are split by their median value.
+    """
+    if not len(top) or not len(bottom):
+        return np.zeros(len(bottom), dtype=bool)
+    if len(top) * len(bottom) <= _BRUTE_FORCE_PAIRS or k >= coords.shape[1]:
+        return np.array(
+            [
+                any(points[t] <= points[b] for t in top.tolist())
+                for b in bottom.tolist()
+            ],
+            dtype=bool,
+        )
+    if k == coords.shape[1] - 1:
+        # a single criterion left, the best top row decides
+        best = points[top[np.argmin(coords[top, k])]]
+        return np.array([best <= points[b] for b in bottom.tolist()], dtype=bool)
+    if k == coords.shape[1] - 2:
+        return _staircase_filter(top, bottom, points, coords, k)
+
+    values = np.unique(coords[np.concatenate([top, bottom]), k])
+    if len(values) == 1:
+        return _filter(top, bottom, points, coords, k + 1)
+    median = values[(len(values) - 1) // 2]
+    top_low = top[coords[top, k] <= median]
+    top_high = top[coords[top, k] > median]
+    is_low = coords[bottom, k] <= median
+
+    dominated = np.empty(len(bottom), dtype=bool)
+    dominated[is_low] = _filter(top_low, bottom[is_low], points, coords, k)
+    high = bottom[~is_low]
+    # low top rows are better on k than high bottom rows, one criterion less to check
+    dominated[~is_low] = _filter(top_high, high, points, coords, k) | _filter(
+        top_low, high, points, coords, k + 1
+    )
+    return dominated
+
+
+def _front(indices: np.ndarray, points: list[Point], coords: np.ndarray) -> np.ndarray:
+    if len(indices) <= 1:
+        return indices
+    half = len(indices) // 2
+    top = _front(indices[:half], points, coords)
+    bottom = _front(indices[half:], points, coords)
+    # lexicographic order guarantees that the bottom half can't dominate the top one
+    dominated = _filter(top, bottom, points, coords, 1)
+    return np.concatenate([top, bottom[~dominated]])
+
+
+def kung_method(points: list[Point]) -> list[Point]:
+    """Kung, Luccio and Preparata divide and conquer algorithm for non-dominated elements in set.
+
+    Halves of the lexicographically sorted points are solved recursively, then the
+    front of the second half is filtered by the first one on the remaining d - 1
+    criteria, again by divide and conquer down to a staircase sweep of the last two.
+    That takes O(n log^(d-2) n) for d >= 3 and O(n log n) for d = 2. Dominance
+    is always decided by comparing Points, so the comparisons are counted.
+    Reference: https://doi.org/10.1145/321906.321910
+    """
+    if not points:
+        return []
+    coords = np.array([p.x for p in points], dtype=float)
+    order = np.lexsort(coords.T[::-1])
+    return [points[i] for i in _front(order, points, coords).tolist()]
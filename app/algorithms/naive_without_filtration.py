@@ -1,6 +1,7 @@
 from typing import Any, List
-from numpy import ones, ndarray
+from numpy import ones, zeros, ndarray, argmax, flatnonzero
 from .point import Point
+from .point_set import PointSet, DEFAULT_BLOCK_SIZE
 
 
 def naive_without_filtering(
@@ -23,3 +24,33 @@ def naive_without_filtering(
                 candidate = x
         non_dominated_results.append(candidate)
     return non_dominated_results
+
+
+def block_naive_without_filtering(
+    points: PointSet, block_size: int = DEFAULT_BLOCK_SIZE
+) -> ndarray:
+    """Block-vectorized naive algorithm without filtering, returns indices of non-dominated rows."""
+    n: int = len(points)
+    active: ndarray = ones(n, dtype=bool)
+    recorded: ndarray = zeros(n, dtype=bool)
+    for i in range(n):
+        if not active[i] or recorded[i]:
+            continue
+        candidate = i
+        start = i + 1
+        while start < n:
+            stop = min(start + block_size, n)
+            block_active = active[start:stop]
+            dominated = points.dominated_by(candidate, start, stop) & block_active
+            dominating = points.dominating(candidate, start, stop) & block_active & ~dominated
+            if dominating.any():
+                k = int(argmax(dominating))
+                block_active[:k] &= ~dominated[:k]
+                active[candidate] = False
+                candidate = start + k
+                start = candidate + 1
+                continue
+            block_active &= ~dominated
+            start = stop
+        recorded[candidate] = True
+    return flatnonzero(recorded)
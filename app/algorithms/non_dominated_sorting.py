@@ -0,0 +1,100 @@
+from bisect import bisect_right
+import numpy as np
+from .point_set import PointSet
+
+# upper bound for the number of coordinate comparisons held in memory at once
+PAIRWISE_BUDGET: int = 2**24
+
+
+def _sort_2d(rows: np.ndarray) -> np.ndarray:
+    """O(n log n) layer assignment for unique rows with 2 criteria."""
+    layers = np.empty(len(rows), dtype=np.intp)
+    # minimum of the second criterion in every layer, non-decreasing across layers
+    tails: list[float] = []
+    order = np.lexsort((rows[:, 1], rows[:, 0]))
+    for idx, y in zip(order.tolist(), rows[order, 1].tolist()):
+        layer = bisect_right(tails, y)
+        if layer == len(tails):
+            tails.append(y)
+        else:
+            tails[layer] = y
+        layers[idx] = layer
+    return layers
+
+
+def _sort_3d(rows: np.ndarray) -> np.ndarray:
+    """O(n log^2 n) layer assignment for unique rows with 3 criteria.
+
+    Rows are swept in lexicographic order like in sweep_3d, with a (y, z)
+    staircase of every layer. The layers dominating a row form a prefix, so the
+    first one which doesn't is found with bisection and the row joins it.
+    """
+    layers = np.empty(len(rows), dtype=np.intp)
+    staircases_y: list[list[float]] = []
+    # negated z values keep the lists ascending, so they can be bisected as well
+    staircases_neg_z: list[list[float]] = []
+    order = np.lexsort((rows[:, 2], rows[:, 1], rows[:, 0]))
+    for idx, y, z in zip(order.tolist(), rows[order, 1].tolist(), rows[order, 2].tolist()):
+        lo, hi = 0, len(staircases_y)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = bisect_right(staircases_y[mid], y)
+            if k and -staircases_neg_z[mid][k - 1] <= z:
+                lo = mid + 1
+            else:
+                hi = mid
+        layers[idx] = lo
+        if lo == len(staircases_y):
+            staircases_y.append([y])
+            staircases_neg_z.append([-z])
+            continue
+        staircase_y, staircase_neg_z = staircases_y[lo], staircases_neg_z[lo]
+        k = bisect_right(staircase_y, y)
+        start = k - 1 if k and staircase_y[k - 1] == y else k
+        stop = bisect_right(staircase_neg_z, -z, start)
+        staircase_y[start:stop] = [y]
+        staircase_neg_z[start:stop] = [-z]
+    return layers
+
+
+def _deb_sort(rows: np.ndarray) -> np.ndarray:
+    """Deb's fast non-dominated sort for unique rows."""
+    n, dim = rows.shape
+    domination_count = np.zeros(n, dtype=np.intp)
+    dominated_rows: list[np.ndarray] = []
+    block_size = max(1, PAIRWISE_BUDGET // max(n * dim, 1))
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        dominates = np.all(rows[start:stop, None, :] <= rows[None, :, :], axis=2)
+        dominates[np.arange(stop - start), np.arange(start, stop)] = False
+        domination_count += dominates.sum(axis=0)
+        dominated_rows.extend(np.flatnonzero(row) for row in dominates)
+
+    layers = np.empty(n, dtype=np.intp)
+    current = np.flatnonzero(domination_count == 0)
+    layer = 0
+    while len(current):
+        layers[current] = layer
+        released = np.bincount(
+            np.concatenate([dominated_rows[i] for i in current]), minlength=n
+        )
+        domination_count -= released
+        current = np.flatnonzero((domination_count == 0) & (released > 0))
+        layer += 1
+    return layers
+
+
+def fast_non_dominated_sort(points: PointSet) -> np.ndarray:
+    """Sorts points into Pareto layers, returns the layer of every row (0 is the front).
+
+    Equal rows share a layer. Two criteria are handled by an O(n log n) sweep,
+    three by an O(n log^2 n) sweep with a staircase per layer, otherwise Deb's
+    algorithm is used.
+    Reference: https://doi.org/10.1109/4235.996017
+    """
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+    rows, inverse = np.unique(points.data, axis=0, return_inverse=True)
+    sort = {2: _sort_2d, 3: _sort_3d}.get(points.dim, _deb_sort)
+    layers = sort(rows)
+    return layers[inverse.reshape(-1)]
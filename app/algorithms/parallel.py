@@ -0,0 +1,138 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Callable
+import numpy as np
+from .point import (
+    ComparisonStats,
+    Point,
+    create_points_from_datapoints,
+    current_comparison_stats,
+    point_positions,
+)
+from .types import OWDAlgorithm
+
+Partitioning = Callable[[np.ndarray, int, np.random.Generator], list[np.ndarray]]
+
+
+def contiguous_partitions(
+    data: np.ndarray, parts: int, rng: np.random.Generator
+) -> list[np.ndarray]:
+    return np.array_split(np.arange(len(data)), parts)
+
+
+def random_partitions(
+    data: np.ndarray, parts: int, rng: np.random.Generator
+) -> list[np.ndarray]:
+    return np.array_split(rng.permutation(len(data)), parts)
+
+
+def angular_partitions(
+    data: np.ndarray, parts: int, rng: np.random.Generator
+) -> list[np.ndarray]:
+    """Splits rows by their angle to the first criterion, as seen from the ideal point.
+
+    Every partition then holds a slice of the front instead of mostly dominated rows.
+    Reference: https://doi.org/10.1145/1376616.1376642
+    """
+    shifted = data - data.min(axis=0)
+    angle = np.arctan2(np.linalg.norm(shifted[:, 1:], axis=1), shifted[:, 0])
+    return np.array_split(np.argsort(angle, kind="stable"), parts)
+
+
+PARTITIONINGS: dict[str, Partitioning] = {
+    "contiguous": contiguous_partitions,
+    "random": random_partitions,
+    "angle": angular_partitions,
+}
+
+
+def _local_front(
+    indices: np.ndarray,
+    shared_name: str,
+    shape: tuple[int, int],
+    algorithm: str,
+    count_comparisons: bool = False,
+) -> tuple[np.ndarray, ComparisonStats | None]:
+    """Local front of a partition, with the worker's comparison stats if requested."""
+    from .interface import NAIVE_ALGORITHMS
+
+    shared = shared_memory.SharedMemory(name=shared_name)
+    try:
+        data = np.ndarray(shape, dtype=np.float64, buffer=shared.buf)
+        points = create_points_from_datapoints(data[indices])
+        del data
+    finally:
+        shared.close()
+    if not count_comparisons:
+        return indices[point_positions(NAIVE_ALGORITHMS[algorithm](points), points)], None
+    with ComparisonStats() as stats:
+        local_front = NAIVE_ALGORITHMS[algorithm](points)
+    return indices[point_positions(local_front, points)], stats
+
+
+def parallel_front(
+    data: np.ndarray,
+    algorithm: str,
+    workers: int | None = None,
+    partitioning: str = "contiguous",
+    seed: int | None = None,
+) -> np.ndarray:
+    """Computes local fronts of the partitions on a process pool and merges them.
+
+    Rows reach the workers through shared memory, only the partition indices are pickled.
+    Comparisons made by the workers are merged into the caller's ComparisonStats.
+    Returns indices of non-dominated rows.
+    """
+    from .interface import NAIVE_ALGORITHMS
+
+    workers = workers or os.cpu_count()
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    partitions = PARTITIONINGS[partitioning](data, workers, np.random.default_rng(seed))
+    partitions = [p for p in partitions if len(p)]
+
+    shared = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        shared_data = np.ndarray(data.shape, dtype=np.float64, buffer=shared.buf)
+        shared_data[:] = data
+        del shared_data
+        stats = current_comparison_stats()
+        compute_local_front = partial(
+            _local_front,
+            shared_name=shared.name,
+            shape=data.shape,
+            algorithm=algorithm,
+            count_comparisons=stats is not None,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compute_local_front, partitions))
+    finally:
+        shared.close()
+        shared.unlink()
+
+    local_fronts = [local_front for local_front, _ in results]
+    if stats is not None:
+        for _, worker_stats in results:
+            stats.merge(worker_stats)
+
+    # the union of local fronts still has to be filtered across partitions
+    if not local_fronts:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.sort(np.concatenate(local_fronts))
+    points = create_points_from_datapoints(data[candidates])
+    return candidates[point_positions(NAIVE_ALGORITHMS[algorithm](points), points)]
+
+
+def parallelize(
+    algorithm: str, workers: int | None = None, partitioning: str = "contiguous"
+) -> OWDAlgorithm:
+    """Wraps an algorithm from NAIVE_ALGORITHMS into its multi-core counterpart."""
+
+    def parallel_algorithm(points: list[Point]) -> list[Point]:
+        if not points:
+            return []
+        data = np.array([p.to_numpy() for p in points], dtype=np.float64)
+        return [points[i] for i in parallel_front(data, algorithm, workers, partitioning)]
+
+    return parallel_algorithm
@@ -1,12 +1,71 @@
 from typing import Iterable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from threading import Lock
 import numpy as np
 
+_instrumentation_lock = Lock()
+
+
+@dataclass
+class ComparisonStats:
+    """Comparison counters of the code run within `with ComparisonStats() as stats:`.
+
+    The active collector lives in a context variable, so concurrent sessions and
+    threads count independently. A thread or a worker process opens its own block
+    and the caller merges the collected stats; a finished nested block is merged
+    into the enclosing one automatically.
+    """
+
+    point_comparisons: int = 0
+    coordinate_comparisons: int = 0
+    _tokens: list[Token] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __enter__(self) -> "ComparisonStats":
+        self._tokens.append(_current_stats.set(self))
+        Point.enable_instrumentation()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        Point.disable_instrumentation()
+        _current_stats.reset(self._tokens.pop())
+        parent = _current_stats.get()
+        if parent is not None:
+            parent.merge(self)
+
+    def __getstate__(self) -> dict[str, int]:
+        return {
+            "point_comparisons": self.point_comparisons,
+            "coordinate_comparisons": self.coordinate_comparisons,
+        }
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        self.__init__(**state)
+
+    def merge(self, other: "ComparisonStats") -> None:
+        self.point_comparisons += other.point_comparisons
+        self.coordinate_comparisons += other.coordinate_comparisons
+
+
+_current_stats: ContextVar[ComparisonStats | None] = ContextVar(
+    "comparison_stats", default=None
+)
+
+
+def current_comparison_stats() -> ComparisonStats | None:
+    """The collector of the innermost active ComparisonStats block, if any."""
+    return _current_stats.get()
+
 
 class Point:
-    """A point in a multi-dimensional space."""
+    """A point in a multi-dimensional space.
+
+    Comparisons are only counted within a ComparisonStats block, e.g. by a benchmark.
+    """
+
+    __slots__ = ("x", "dim")
 
-    global_point_counter: int = 0
-    global_coordinate_counter: int = 0
+    _instrumentation_users: int = 0
 
     def __init__(self, x: np.array) -> None:
         self.x: np.array = x
@@ -22,58 +81,74 @@ class Point:
         return f"Point({self.x})"
 
     def __eq__(self, other: "Point") -> bool:
-        self.__class__.global_point_counter += 1
+        return bool((self.x == other.x).all())
+
+    def __le__(self, other: "Point") -> bool:
+        return bool((self.x <= other.x).all())
+
+    def __ge__(self, other: "Point") -> bool:
+        return bool((self.x >= other.x).all())
+
+    def _counted_eq(self, other: "Point") -> bool:
         predicate = self.x == other.x
-        self.__class__.global_coordinate_counter += np.argmin(predicate) + 1
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.point_comparisons += 1
+            stats.coordinate_comparisons += int(np.argmin(predicate)) + 1
         return np.all(predicate)
 
-    def __le__(self, other: "Point") -> bool:
-        self.__class__.global_point_counter += 1
+    def _counted_le(self, other: "Point") -> bool:
         predicate = self.x <= other.x
-        self.__class__.global_coordinate_counter += np.argmin(predicate) + 1
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.point_comparisons += 1
+            stats.coordinate_comparisons += int(np.argmin(predicate)) + 1
         return np.all(predicate)
 
-    def __ge__(self, other: "Point") -> bool:
-        self.__class__.global_point_counter += 1
+    def _counted_ge(self, other: "Point") -> bool:
         predicate = self.x >= other.x
-        self.__class__.global_coordinate_counter += np.argmin(predicate) + 1
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.point_comparisons += 1
+            stats.coordinate_comparisons += int(np.argmin(predicate)) + 1
         return np.all(predicate)
 
-    def to_numpy(self) -> np.ndarray:
-        """Converts the point to a numpy array."""
-        return self.x
+    _fast_comparisons = {"__eq__": __eq__, "__le__": __le__, "__ge__": __ge__}
+    _counted_comparisons = {
+        "__eq__": _counted_eq,
+        "__le__": _counted_le,
+        "__ge__": _counted_ge,
+    }
 
     @classmethod
-    def reset_counter(cls) -> None:
-        cls.global_point_counter = 0
-        cls.global_coordinate_counter = 0
+    def enable_instrumentation(cls) -> None:
+        """Switches to the counting comparisons, calls have to be paired with disable_instrumentation."""
+        with _instrumentation_lock:
+            if cls._instrumentation_users == 0:
+                for name, comparison in cls._counted_comparisons.items():
+                    setattr(cls, name, comparison)
+            cls._instrumentation_users += 1
 
     @classmethod
-    def get_global_point_counter(cls) -> int:
-        return cls.global_point_counter
+    def disable_instrumentation(cls) -> None:
+        with _instrumentation_lock:
+            cls._instrumentation_users -= 1
+            if cls._instrumentation_users == 0:
+                for name, comparison in cls._fast_comparisons.items():
+                    setattr(cls, name, comparison)
 
-    @classmethod
-    def get_global_coordinate_counter(cls) -> int:
-        return cls.global_coordinate_counter
-
-    def adjust_signs_for_optimization(self, directions: list[str]) -> None:
-        if len(directions) != self.dim:
-            raise ValueError(
-                "Length of directions must match the dimensionality of the point."
-            )
-
-        for i, direction in enumerate(directions):
-            if direction == "Min":
-                self.x[i] = self.x[i]
-            elif direction == "Max":
-                self.x[i] = -self.x[i]
-            else:
-                raise ValueError(
-                    f"Invalid optimization direction '{direction}' at index {i}; expected 'Min' or 'Max'."
-                )
+    def to_numpy(self) -> np.ndarray:
+        """Converts the point to a numpy array."""
+        return self.x
 
 
 def create_points_from_datapoints(
     datapoints: Iterable[tuple[int | float]],
 ) -> list[Point]:
     return [Point(np.array(dp)) for dp in datapoints]
+
+
+def point_positions(selected: list[Point], points: list[Point]) -> np.ndarray:
+    """Positions of the points returned by an algorithm within its input list."""
+    position_of = {id(p): i for i, p in enumerate(points)}
+    return np.array([position_of[id(p)] for p in selected], dtype=np.intp)
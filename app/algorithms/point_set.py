@@ -0,0 +1,123 @@
+from functools import cached_property, wraps
+from typing import Callable, Iterable, Iterator
+import numpy as np
+from .point import Point, point_positions
+
+DEFAULT_BLOCK_SIZE: int = 4096
+DEFAULT_CHUNK_SIZE: int = 100_000
+
+
+def row_chunks(data: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Yields consecutive row slices, which are views for in-memory and memory-mapped arrays alike."""
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+def direction_signs(directions: list[str]) -> np.ndarray:
+    """Returns a vector which turns every criterion into a minimised one."""
+    signs = np.empty(len(directions))
+    for i, direction in enumerate(directions):
+        if direction == "Min":
+            signs[i] = 1.0
+        elif direction == "Max":
+            signs[i] = -1.0
+        else:
+            raise ValueError(
+                f"Invalid optimization direction '{direction}' at index {i}; expected 'Min' or 'Max'."
+            )
+    return signs
+
+
+class PointSet:
+    """A contiguous (n, d) array of points in a multi-dimensional space.
+
+    Column statistics are computed on first access and shared by every method
+    the set is passed to, so the data must not be modified afterwards.
+    """
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.ascontiguousarray(data, dtype=float)
+        if data.ndim != 2:
+            raise ValueError("PointSet expects a two dimensional (n, d) array.")
+        self.data: np.ndarray = data
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __repr__(self) -> str:
+        return f"PointSet(n={len(self)}, dim={self.dim})"
+
+    @property
+    def dim(self) -> int:
+        return self.data.shape[1]
+
+    @cached_property
+    def column_min(self) -> np.ndarray:
+        return self.data.min(axis=0)
+
+    @cached_property
+    def column_max(self) -> np.ndarray:
+        return self.data.max(axis=0)
+
+    @cached_property
+    def column_norms(self) -> np.ndarray:
+        """Euclidean norm of every column."""
+        return np.sqrt((self.data**2).sum(axis=0))
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointSet":
+        return cls(np.array([p.to_numpy() for p in points], dtype=float))
+
+    def to_points(self, indices: Iterable[int] | None = None) -> list[Point]:
+        rows = self.data if indices is None else self.data[np.asarray(indices)]
+        return [Point(row.copy()) for row in rows]
+
+    def dominated_by(self, candidate: int, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Mask of rows in [start, stop) which are weakly dominated by the candidate row."""
+        return np.all(self.data[candidate] <= self.data[start:stop], axis=1)
+
+    def dominating(self, candidate: int, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Mask of rows in [start, stop) which weakly dominate the candidate row."""
+        return np.all(self.data[start:stop] <= self.data[candidate], axis=1)
+
+    def filter_dominated(
+        self, candidate: int, active: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> None:
+        """Deactivates every active row weakly dominated by the candidate row."""
+        for start in range(0, len(self), block_size):
+            stop = min(start + block_size, len(self))
+            block_active = active[start:stop]
+            if not block_active.any():
+                continue
+            block_active &= ~self.dominated_by(candidate, start, stop)
+
+
+def as_matrix(points: "list[Point] | np.ndarray | PointSet") -> np.ndarray:
+    """(n, d) float matrix of points given as a list of Points, an array or a PointSet."""
+    if isinstance(points, PointSet):
+        return points.data
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=float)
+    return np.array([p.to_numpy() for p in points], dtype=float)
+
+
+def as_point_set(points: "list[Point] | np.ndarray | PointSet") -> PointSet:
+    """PointSet of a list of Points or an array, a PointSet is returned as is."""
+    if isinstance(points, PointSet):
+        return points
+    if isinstance(points, np.ndarray):
+        return PointSet(points)
+    return PointSet.from_points(points)
+
+
+def index_algorithm(
+    algorithm: Callable[[list[Point]], list[Point]],
+) -> Callable[[PointSet], np.ndarray]:
+    """Adapts a Point based algorithm to return indices of the non-dominated rows."""
+
+    @wraps(algorithm)
+    def indexed_algorithm(points: PointSet) -> np.ndarray:
+        point_list = points.to_points()
+        return point_positions(algorithm(point_list), point_list)
+
+    return indexed_algorithm
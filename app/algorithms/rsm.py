@@ -1,28 +1,72 @@
 from typing import List
-from .types import Ranking, Point
 import numpy as np
+from scipy.spatial.distance import cdist
+from .point_set import PointSet, as_point_set, row_chunks
+from .types import Ranking, Point
+
+# upper bound for the (chunk, reference points) distance matrix of a block
+DEFAULT_MEMORY_LIMIT: int = 64 * 2**20
+
+
+def normalize(
+    data: np.array, bounds: tuple[np.array, np.array] | None = None
+) -> np.array:
+    """Min-max scaling of every column, constant columns become 0.
+
+    Precomputed column minima and maxima can be passed as bounds.
+    """
+    min_vals, max_vals = bounds or (np.min(data, axis=0), np.max(data, axis=0))
+    ranges = max_vals - min_vals
+    return (data - min_vals) / np.where(ranges > 0, ranges, 1)
+
+
+def calculate_sums_of_distances(
+    alternatives: np.array,
+    point_sets: List[np.array],
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> List[np.array]:
+    """Sums of Euclidean distances of every alternative to the points of every set.
 
-def normalize(data: np.array) -> np.array:
-    min_vals = np.min(data, axis=0)
-    max_vals = np.max(data, axis=0)
-    return (data - min_vals) / (max_vals - min_vals)
+    The sets are stacked, so every block of alternatives needs a single cdist call,
+    blocks are sized so the distance matrix fits in memory_limit bytes.
+    """
+    reference_points = np.vstack(point_sets)
+    boundaries = np.cumsum([len(point_set) for point_set in point_sets])[:-1]
+    chunk_size = max(1, memory_limit // (8 * max(len(reference_points), 1)))
+    sums = np.empty((len(alternatives), len(point_sets)))
+    start = 0
+    for chunk in row_chunks(alternatives, chunk_size):
+        distances = cdist(chunk, reference_points)
+        for i, block in enumerate(np.split(distances, boundaries, axis=1)):
+            sums[start : start + len(chunk), i] = block.sum(axis=1)
+        start += len(chunk)
+    return list(sums.T)
 
-def calculate_sum_of_distances(alternative: np.array, point_set: np.array) -> float:
-    return np.sum(np.linalg.norm(point_set - alternative, axis=1))
 
-def reference_set_method(alternatives: List[Point], weights: np.array, ideal_points_set: np.array, status_quo_points_set: np.array) -> Ranking:
-    alternatives = [p.to_numpy() for p in alternatives]
-    normalized_alternatives = normalize(np.array(alternatives))
+def reference_set_method(
+    alternatives: List[Point] | np.ndarray | PointSet,
+    weights: np.array,
+    ideal_points_set: np.array,
+    status_quo_points_set: np.array,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> Ranking:
+    point_set = as_point_set(alternatives)
+    normalized_alternatives = normalize(
+        point_set.data, (point_set.column_min, point_set.column_max)
+    )
 
     weighted_alternatives = normalized_alternatives * weights
 
-    scores = []
-    for alternative in weighted_alternatives:
-        dist_ideal = calculate_sum_of_distances(alternative, ideal_points_set)
-        dist_antiideal = calculate_sum_of_distances(alternative, status_quo_points_set)
-        score = dist_ideal / (dist_ideal + dist_antiideal)
-        scores.append(score)
-    scores = np.array(scores)
+    dimensionality = weighted_alternatives.shape[1]
+    dist_ideal, dist_antiideal = calculate_sums_of_distances(
+        weighted_alternatives,
+        [
+            np.asarray(ideal_points_set, dtype=float).reshape(-1, dimensionality),
+            np.asarray(status_quo_points_set, dtype=float).reshape(-1, dimensionality),
+        ],
+        memory_limit,
+    )
+    scores = dist_ideal / (dist_ideal + dist_antiideal)
 
     sorted_indices = np.argsort(-scores)
     sorted_scores = scores[sorted_indices]
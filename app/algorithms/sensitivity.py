@@ -0,0 +1,101 @@
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+import numpy as np
+from .point_set import PointSet
+
+# weight vectors evaluated together by a single task
+DEFAULT_BATCH_SIZE: int = 1000
+
+
+def sample_weights(
+    samples: int,
+    dim: int,
+    rng: np.random.Generator,
+    box: tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """(samples, dim) weight vectors.
+
+    Without a box the weights are uniform on the simplex (Dirichlet with unit
+    concentration), otherwise uniform within the [lower, upper] box.
+    """
+    if box is None:
+        return rng.dirichlet(np.ones(dim), size=samples)
+    lower, upper = (np.broadcast_to(np.asarray(b, dtype=float), (dim,)) for b in box)
+    if np.any(lower > upper) or np.any(lower < 0):
+        raise ValueError("The weight box needs 0 <= lower <= upper for every criterion.")
+    return rng.uniform(lower, upper, size=(samples, dim))
+
+
+def _rank_counts(rankings: np.ndarray, alternatives: int) -> np.ndarray:
+    """(alternatives, ranks) counts of every alternative holding every rank."""
+    ranks = np.broadcast_to(np.arange(rankings.shape[1]), rankings.shape)
+    counts = np.bincount(
+        (rankings * alternatives + ranks).ravel(), minlength=alternatives**2
+    )
+    return counts.reshape(alternatives, alternatives)
+
+
+def _evaluate_batch(
+    seed: np.random.SeedSequence,
+    samples: int,
+    data: np.ndarray,
+    method: str,
+    box: tuple[np.ndarray, np.ndarray] | None,
+    options: dict[str, Any],
+) -> np.ndarray:
+    from .interface import BATCH_RANKING_ALGORITHMS, RANKING_ALGORITHMS
+
+    weights = sample_weights(samples, data.shape[1], np.random.default_rng(seed), box)
+    batch_method = BATCH_RANKING_ALGORITHMS.get(method)
+    # options only the single vector method takes (e.g. UTA Star reference sets)
+    # fall back to evaluating every weight vector separately
+    if batch_method is not None and set(options) <= set(
+        inspect.signature(batch_method).parameters
+    ):
+        rankings, _ = batch_method(data, weights, **options)
+    else:
+        ranking_method = partial(RANKING_ALGORITHMS[method], **options)
+        points = PointSet(data)
+        rankings = np.array([ranking_method(points, w)[0] for w in weights])
+    return _rank_counts(rankings, len(data))
+
+
+def rank_acceptability(
+    data: np.ndarray,
+    method: str,
+    samples: int = 1000,
+    seed: int | None = 0,
+    box: tuple[np.ndarray, np.ndarray] | None = None,
+    workers: int | None = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    options: dict[str, Any] | None = None,
+) -> np.ndarray:
+    """Monte Carlo rank acceptability indices of a method from RANKING_ALGORITHMS.
+
+    Returns an (n, n) array whose [i, r] entry is the share of sampled weight
+    vectors for which alternative i holds rank r (0 is the best). The samples are
+    split into batches with their own seeds, so the result only depends on the
+    seed, not on the number of workers. Options are passed to the method, e.g. the
+    reference sets of RSM.
+    Reference: https://doi.org/10.1016/S0377-2217(97)00163-X
+    """
+    if samples < 1:
+        raise ValueError("At least one weight vector has to be sampled.")
+    data = np.asarray(data, dtype=float)
+    batches = [
+        min(batch_size, samples - start) for start in range(0, samples, batch_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    evaluate = partial(
+        _evaluate_batch, data=data, method=method, box=box, options=options or {}
+    )
+    workers = min(workers or os.cpu_count() or 1, len(batches))
+    if workers == 1:
+        counts = [evaluate(s, n) for s, n in zip(seeds, batches)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(evaluate, seeds, batches))
+    return np.sum(counts, axis=0) / samples
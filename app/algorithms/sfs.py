@@ -0,0 +1,50 @@
+import numpy as np
+from .point import Point
+from .types import PresortFunction
+
+
+def sum_score(data: np.ndarray) -> np.ndarray:
+    return data.sum(axis=1)
+
+
+def entropy_score(data: np.ndarray) -> np.ndarray:
+    minimum = data.min(axis=0)
+    span = data.max(axis=0) - minimum
+    span[span == 0] = 1
+    return np.log1p((data - minimum) / span).sum(axis=1)
+
+
+def ideal_point_distance_score(data: np.ndarray) -> np.ndarray:
+    return np.square(data - data.min(axis=0)).sum(axis=1)
+
+
+PRESORT_FUNCTIONS: dict[str, PresortFunction] = {
+    "sum": sum_score,
+    "entropy": entropy_score,
+    "distance to ideal": ideal_point_distance_score,
+}
+
+
+def sort_filter_skyline(
+    points: list[Point], presort: str | PresortFunction = "entropy"
+) -> list[Point]:
+    """Sort-Filter-Skyline algorithm for non-dominated elements in set.
+
+    The presort score has to be monotone, so a point can only be dominated by
+    points which come before it - every candidate is compared against the window
+    of already confirmed non-dominated points and never scanned again.
+    Reference: https://doi.org/10.1109/ICDE.2003.1260846
+    """
+    if not points:
+        return []
+    score = PRESORT_FUNCTIONS[presort] if isinstance(presort, str) else presort
+    data = np.array([p.to_numpy() for p in points])
+    # equal scores are ordered lexicographically, which keeps dominators first
+    order = np.lexsort((*data.T[::-1], score(data)))
+
+    window: list[Point] = []
+    for idx in order:
+        candidate = points[idx]
+        if not any(w <= candidate for w in window):
+            window.append(candidate)
+    return window
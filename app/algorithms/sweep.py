@@ -0,0 +1,49 @@
+from bisect import bisect_right
+import numpy as np
+from .point_set import PointSet
+from .types import VectorizedOWDAlgorithm
+
+
+def sweep_2d(points: PointSet) -> np.ndarray:
+    """Sort and running minimum scan for 2 criteria, returns indices of non-dominated rows."""
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+    data = points.data
+    order = np.lexsort((data[:, 1], data[:, 0]))
+    y = data[order, 1]
+    running_min = np.minimum.accumulate(y)
+    is_non_dominated = np.empty(len(points), dtype=bool)
+    is_non_dominated[0] = True
+    # a row is dominated by an earlier one unless it lowers the running minimum
+    is_non_dominated[1:] = y[1:] < running_min[:-1]
+    return order[is_non_dominated]
+
+
+def sweep_3d(points: PointSet) -> np.ndarray:
+    """Sort and staircase sweep for 3 criteria, returns indices of non-dominated rows.
+
+    The staircase holds the (y, z) projection of the front found so far,
+    ordered by increasing y (and so decreasing z), and is searched with bisection.
+    """
+    data = points.data
+    order = np.lexsort((data[:, 2], data[:, 1], data[:, 0]))
+    staircase_y: list[float] = []
+    # negated z values keep the list ascending, so it can be bisected as well
+    staircase_neg_z: list[float] = []
+    non_dominated = []
+    for idx, y, z in zip(order.tolist(), data[order, 1].tolist(), data[order, 2].tolist()):
+        k = bisect_right(staircase_y, y)
+        if k and -staircase_neg_z[k - 1] <= z:
+            continue
+        lo = k - 1 if k and staircase_y[k - 1] == y else k
+        hi = bisect_right(staircase_neg_z, -z, lo)
+        staircase_y[lo:hi] = [y]
+        staircase_neg_z[lo:hi] = [-z]
+        non_dominated.append(idx)
+    return np.array(non_dominated, dtype=np.intp)
+
+
+SWEEP_ALGORITHMS: dict[int, VectorizedOWDAlgorithm] = {
+    2: sweep_2d,
+    3: sweep_3d,
+}
@@ -1,13 +1,23 @@
 import numpy as np
 from .point import Point
-from .types import Ranking
+from .point_set import PointSet, as_point_set
+from .types import BatchRanking, Ranking
 
+# upper bound for the (chunk, n) temporaries of a batched evaluation
+DEFAULT_MEMORY_LIMIT: int = 64 * 2**20
 
-def topsis(points: list[Point], weights: list[float]) -> Ranking:
+
+def normalize(point_set: PointSet) -> np.ndarray:
+    """Columns divided by their Euclidean norms, all-zero columns stay 0."""
+    norms = point_set.column_norms
+    return point_set.data / np.where(norms > 0, norms, 1)
+
+
+def topsis(points: list[Point] | np.ndarray | PointSet, weights: list[float]) -> Ranking:
     """Reference: https://en.wikipedia.org/wiki/TOPSIS"""
-    data_matrix = np.array([p.to_numpy() for p in points])
+    point_set = as_point_set(points)
 
-    norm_matrix = data_matrix / np.sqrt((data_matrix**2).sum(axis=0))
+    norm_matrix = normalize(point_set)
 
     weighted_matrix = norm_matrix * weights
 
@@ -29,3 +39,51 @@ def topsis(points: list[Point], weights: list[float]) -> Ranking:
     sorted_scores = relative_closeness[sorted_indices]
 
     return sorted_indices.tolist(), sorted_scores.tolist()
+
+
+def topsis_batch(
+    points: list[Point] | np.ndarray | PointSet,
+    weight_matrix: np.ndarray,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> BatchRanking:
+    """TOPSIS for every row of a (k, d) weight matrix at once.
+
+    The data is normalised once, by the column norms of the PointSet, and squared
+    distances are expanded into matrix products, so no (k, n, d) array is built. Weight vectors are processed in
+    chunks whose temporaries fit in memory_limit bytes. Returns (k, n) rankings
+    and (k, n) relative closeness of the alternatives in their original order.
+    """
+    point_set = as_point_set(points)
+    data_matrix = point_set.data
+    weights = np.atleast_2d(np.asarray(weight_matrix, dtype=float))
+    if weights.shape[1] != data_matrix.shape[1]:
+        raise ValueError("Every weight vector needs one weight per criterion.")
+
+    norm_matrix = normalize(point_set)
+    squared_norm_matrix = norm_matrix**2
+    column_max, column_min = norm_matrix.max(axis=0), norm_matrix.min(axis=0)
+
+    scores = np.empty((len(weights), len(data_matrix)))
+    chunk_size = max(1, memory_limit // (4 * 8 * max(len(data_matrix), 1)))
+    for start in range(0, len(weights), chunk_size):
+        chunk = weights[start : start + chunk_size]
+        # the best and the worst weighted value of a column depend on the sign of the weight
+        ideal_solution = np.maximum(chunk * column_max, chunk * column_min)
+        negative_ideal_solution = np.minimum(chunk * column_max, chunk * column_min)
+        weighted_squares = (chunk**2) @ squared_norm_matrix.T
+
+        def separation(reference: np.ndarray) -> np.ndarray:
+            squared = (
+                weighted_squares
+                - 2 * (chunk * reference) @ norm_matrix.T
+                + (reference**2).sum(axis=1, keepdims=True)
+            )
+            return np.sqrt(np.maximum(squared, 0))
+
+        separation_from_ideal = separation(ideal_solution)
+        separation_from_negative_ideal = separation(negative_ideal_solution)
+        scores[start : start + chunk_size] = separation_from_negative_ideal / (
+            separation_from_ideal + separation_from_negative_ideal
+        )
+
+    return np.argsort(-scores, axis=1), scores
@@ -1,7 +1,16 @@
 from typing import Callable
+import numpy as np
 from .point import Point
+from .point_set import PointSet
 
 OWDAlgorithm = Callable[[list[Point]], list[Point]]
+VectorizedOWDAlgorithm = Callable[[PointSet], np.ndarray]
+NonDominatedSorting = Callable[[PointSet], np.ndarray]
 Ranking = tuple[list[int], list[float]]
-RankingMethod = Callable[[list[Point], list[float]], Ranking]
-distribution_callable = Callable[[int, int], list[Point]]
+# every method also accepts a PointSet, sharing its column statistics
+RankingMethod = Callable[[list[Point] | PointSet, list[float]], Ranking]
+# rankings and scores of the alternatives (in their original order) for k weight vectors
+BatchRanking = tuple[np.ndarray, np.ndarray]
+BatchRankingMethod = Callable[[np.ndarray, np.ndarray], BatchRanking]
+distribution_callable = Callable[[int, int, np.random.Generator | None], list[Point]]
+PresortFunction = Callable[[np.ndarray], np.ndarray]
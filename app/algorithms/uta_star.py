@@ -1,68 +1,186 @@
-from .point import Point
-from .types import Ranking
-from typing import List
+from typing import Sequence
 import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+from .point import Point
+from .point_set import PointSet, as_matrix
+from .types import BatchRanking, Ranking
+
+# upper bound for the (chunk, n) scores of a batched evaluation
+DEFAULT_MEMORY_LIMIT: int = 64 * 2**20
+
+
+def criterion_breakpoints(
+    data: np.ndarray, breakpoint_counts: int | Sequence[int] = 2
+) -> list[np.ndarray]:
+    """Breakpoints of every criterion at evenly spaced percentiles of its column.
+
+    Coinciding breakpoints (e.g. of a constant column) are merged, so every
+    array is strictly increasing.
+    """
+    counts = np.broadcast_to(breakpoint_counts, (data.shape[1],))
+    if np.any(counts < 2):
+        raise ValueError("Every criterion needs at least 2 breakpoints.")
+    return [
+        np.unique(np.percentile(column, np.linspace(0, 100, count)))
+        for column, count in zip(data.T, counts)
+    ]
+
+
+def linear_marginal_utilities(
+    breakpoints: list[np.ndarray], weights: Sequence[float]
+) -> list[np.ndarray]:
+    """Utilities at the breakpoints falling evenly from the weight of the criterion to 0.
+
+    Criteria are minimised, like in the fitted utilities, and a criterion with a
+    single breakpoint contributes nothing.
+    """
+    return [
+        weight * np.arange(len(points) - 1, -1, -1) / max(len(points) - 1, 1)
+        for points, weight in zip(breakpoints, weights)
+    ]
+
+
+def marginal_utility_matrix(
+    data: np.ndarray, breakpoints: list[np.ndarray], utilities: list[np.ndarray]
+) -> np.ndarray:
+    """(n, d) marginal utilities, interpolated between the breakpoints of every column."""
+    return np.column_stack(
+        [
+            np.interp(column, points, values)
+            for column, points, values in zip(data.T, breakpoints, utilities)
+        ]
+    )
+
+
+def interval_features(data: np.ndarray, breakpoints: list[np.ndarray]) -> np.ndarray:
+    """(n, intervals) share of every interval between consecutive breakpoints above the row.
+
+    The utility of a row is the dot product of its features and the utility
+    increments of the intervals, so it decreases as the (minimised) values rise.
+    """
+    features = [
+        np.clip((points[1:] - column[:, None]) / np.diff(points), 0, 1)
+        for column, points in zip(data.T, breakpoints)
+    ]
+    return np.hstack(features)
+
+
+def fit_marginal_utilities(
+    breakpoints: list[np.ndarray],
+    preferred_points_set: np.ndarray,
+    non_preferred_points_set: np.ndarray,
+    delta: float = 1e-3,
+) -> list[np.ndarray]:
+    """Marginal utilities fitted with the UTA STAR linear program.
+
+    Criteria are minimised, so utilities don't increase with the values. Utility
+    increments of the intervals are non-negative and sum up to 1. Every
+    preferred point should have a utility higher by delta than every
+    non-preferred one, the sum of the errors needed to satisfy it is minimised.
+    The constraints of all the pairs are kept in a sparse matrix.
+    Reference: https://doi.org/10.1016/0377-2217(82)90155-2
+    """
+    preferred = interval_features(np.atleast_2d(preferred_points_set), breakpoints)
+    non_preferred = interval_features(
+        np.atleast_2d(non_preferred_points_set), breakpoints
+    )
+    if not len(preferred) or not len(non_preferred):
+        raise ValueError("Both reference sets need at least one point.")
+    intervals = preferred.shape[1]
+    n_preferred, n_non_preferred = len(preferred), len(non_preferred)
+
+    # variables: interval increments, then errors of preferred and non-preferred points
+    pairs_a, pairs_b = np.divmod(
+        np.arange(n_preferred * n_non_preferred), n_non_preferred
+    )
+    rows = np.arange(len(pairs_a))
+    errors = sparse.csr_matrix(
+        (
+            np.ones(2 * len(rows)),
+            (np.tile(rows, 2), np.concatenate([pairs_a, n_preferred + pairs_b])),
+        ),
+        shape=(len(rows), n_preferred + n_non_preferred),
+    )
+    differences = (
+        sparse.csr_matrix(preferred)[pairs_a]
+        - sparse.csr_matrix(non_preferred)[pairs_b]
+    )
+    # U(a) - U(b) + error(a) + error(b) >= delta
+    A_ub = -sparse.hstack([differences, errors], format="csr")
+    b_ub = np.full(len(rows), -delta)
+    A_eq = np.concatenate([np.ones(intervals), np.zeros(errors.shape[1])])[None]
+    cost = np.concatenate([np.zeros(intervals), np.ones(errors.shape[1])])
+
+    result = linprog(cost, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1], method="highs")
+    if not result.success:
+        raise ValueError(f"UTA STAR linear program failed: {result.message}")
+    boundaries = np.cumsum([len(points) - 1 for points in breakpoints])[:-1]
+    increments = np.split(result.x[:intervals], boundaries)
+    # utility at a breakpoint is the sum of the increments of the intervals above it
+    return [np.concatenate([np.cumsum(step[::-1])[::-1], [0.0]]) for step in increments]
+
+
+def uta_star(
+    points: list[Point] | np.ndarray | PointSet,
+    weights: list[float],
+    breakpoint_counts: int | Sequence[int] = 2,
+    preferred_points_set: np.ndarray | None = None,
+    non_preferred_points_set: np.ndarray | None = None,
+) -> Ranking:
+    """Ranks by the sum of piecewise linear marginal utilities.
+
+    Breakpoint counts may be given per criterion. Marginal utilities fall evenly
+    from the weights to 0 on the minimised criteria, unless both reference sets are given: then they are fitted
+    to prefer the first set over the second one on minimised criteria and the
+    weights aren't used.
+    """
+    data_matrix = as_matrix(points)
+    breakpoints = criterion_breakpoints(data_matrix, breakpoint_counts)
+    if preferred_points_set is not None and non_preferred_points_set is not None:
+        utilities = fit_marginal_utilities(
+            breakpoints, preferred_points_set, non_preferred_points_set
+        )
+    else:
+        utilities = linear_marginal_utilities(breakpoints, weights)
+
+    uta_star_values = marginal_utility_matrix(data_matrix, breakpoints, utilities).sum(
+        axis=1
+    )
+    # stable, so ties keep the order of the alternatives
+    ranking = np.argsort(-uta_star_values, kind="stable")
+    return ranking.tolist(), uta_star_values[ranking].tolist()
+
+
+def uta_star_batch(
+    points: list[Point] | np.ndarray | PointSet,
+    weight_matrix: np.ndarray,
+    breakpoint_counts: int | Sequence[int] = 2,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> BatchRanking:
+    """UTA Star with linear marginal utilities for every row of a (k, d) weight matrix.
+
+    Utilities are linear in the weights, so the marginal utilities of unit weights
+    are interpolated once and every chunk of weight vectors is a matrix product.
+    Returns (k, n) rankings and (k, n) utilities in the original order.
+    """
+    data_matrix = as_matrix(points)
+    weights = np.atleast_2d(np.asarray(weight_matrix, dtype=float))
+    if weights.shape[1] != data_matrix.shape[1]:
+        raise ValueError("Every weight vector needs one weight per criterion.")
 
+    breakpoints = criterion_breakpoints(data_matrix, breakpoint_counts)
+    unit_utilities = marginal_utility_matrix(
+        data_matrix,
+        breakpoints,
+        linear_marginal_utilities(breakpoints, np.ones(data_matrix.shape[1])),
+    )
 
-def divide_into_parts(points: List[Point], num_of_parts: List[int]) -> List[List[List[float]]]:
-    parts = []
-    for i in range(len(points[0].x)):
-        values = [point.x[i] for point in points]
-        elem = np.percentile(values, np.linspace(0, 100, num_of_parts[i]))
-        parts.append(elem.tolist())
-    return parts
-
-
-def create_usability_function_values(weights: List[float], size: int, parts: List[List[List[float]]]) -> List[dict]:
-    function_values = []
-    for i in range(size):
-        num_of_parts = len(parts[i])
-        value = {parts[i][j]: weights[i] * j for j in range(num_of_parts)}
-        function_values.append(value)
-    return function_values
-
-
-def create_functions(function_values: List[dict]) -> List[dict]:
-    function_values_in_intervals = []
-    for i in range(len(function_values)):
-        key_list = list(function_values[i].keys())
-        value_list = list(function_values[i].values())
-        values_for_interval = {}
-        for j in range(len(function_values[i]) - 1):
-            a = (value_list[j] - value_list[j + 1]) / (key_list[j] - key_list[j + 1])
-            b = value_list[j] - a * key_list[j]
-            values_for_interval[(key_list[j], key_list[j + 1])] = (a, b)
-        function_values_in_intervals.append(values_for_interval)
-    return function_values_in_intervals
-
-
-def create_solution_table(points: List[Point], size: int, function_values_in_intervals: List[dict]) -> List[float]:
-    uta_star_values = []
-    for point in points:
-        u_values = []
-        for i in range(size):
-            for key, value in function_values_in_intervals[i].items():
-                if key[0] <= point.x[i] <= key[1]:
-                    u_values.append(value[0] * point.x[i] + value[1])
-                    break
-        uta_star_values.append(sum(u_values))
-    return uta_star_values
-
-
-def return_solution(uta_star_values: List[float]) -> Ranking:
-    ranking = sorted(range(len(uta_star_values)), key=lambda k: uta_star_values[k], reverse=True)
-    points_values = [uta_star_values[i] for i in ranking]
-    return ranking, points_values
-
-
-def uta_star(points: List[Point], weights: List[float]) -> Ranking:
-    size = len(points[0].x)
-    num_of_parts = [2] * size
-    parts = divide_into_parts(points, num_of_parts)
-
-    function_values = create_usability_function_values(weights, size, parts)
-    function_values_in_intervals = create_functions(function_values)
-
-    uta_star_values = create_solution_table(points, size, function_values_in_intervals)
-    ranking, points_values = return_solution(uta_star_values)
-    return ranking, points_values
+    scores = np.empty((len(weights), len(data_matrix)))
+    rankings = np.empty(scores.shape, dtype=np.intp)
+    chunk_size = max(1, memory_limit // (2 * 8 * max(len(data_matrix), 1)))
+    for start in range(0, len(weights), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        scores[chunk] = weights[chunk] @ unit_utilities.T
+        rankings[chunk] = np.argsort(-scores[chunk], axis=1, kind="stable")
+    return rankings, scores
@@ -1,7 +1,11 @@
 from enum import Enum, auto
 import numpy as np
 from .point import Point
-from .types import Ranking
+from .point_set import PointSet, as_point_set
+from .types import BatchRanking, Ranking
+
+# upper bound for the (chunk, n, d) temporaries of a batched evaluation
+DEFAULT_MEMORY_LIMIT: int = 64 * 2**20
 
 
 class CompromiseStrategy(Enum):
@@ -28,17 +32,21 @@ def get_strategy_thresholds(strategy: CompromiseStrategy) -> float:
         raise ValueError(f"Unknown strategy: {strategy}")
 
 
+def normalize(point_set: PointSet) -> np.ndarray:
+    """Min-max scaling of every column by the PointSet statistics, constant columns become 0."""
+    ranges = point_set.column_max - point_set.column_min
+    return (point_set.data - point_set.column_min) / np.where(ranges > 0, ranges, 1)
+
+
 def vikor(
-    points: list[Point],
+    points: list[Point] | np.ndarray | PointSet,
     weights: list[float],
     strategy: CompromiseStrategy = CompromiseStrategy.ByConsensus,
 ) -> Ranking:
     """Reference: https://en.wikipedia.org/wiki/VIKOR_method"""
-    data = np.array([p.to_numpy() for p in points])
+    point_set = as_point_set(points)
 
-    min_values = data.min(axis=0)
-    max_values = data.max(axis=0)
-    norm_data = (data - min_values) / (max_values - min_values)
+    norm_data = normalize(point_set)
 
     weighted_data = norm_data * weights
     S = weighted_data.sum(axis=1)
@@ -54,3 +62,41 @@ def vikor(
     sorted_q_values = Q[sorted_indices]
 
     return sorted_indices.tolist(), sorted_q_values.tolist()
+
+
+def vikor_batch(
+    points: list[Point] | np.ndarray | PointSet,
+    weight_matrix: np.ndarray,
+    strategy: CompromiseStrategy = CompromiseStrategy.ByConsensus,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+) -> BatchRanking:
+    """VIKOR for every row of a (k, d) weight matrix at once.
+
+    The data is normalised once, by the column minima and maxima of the PointSet,
+    weight vectors are processed in chunks whose (chunk, n, d) temporaries fit in
+    memory_limit bytes. Returns (k, n) rankings and (k, n) Q values of the
+    alternatives in their original order.
+    """
+    point_set = as_point_set(points)
+    data = point_set.data
+    weights = np.atleast_2d(np.asarray(weight_matrix, dtype=float))
+    if weights.shape[1] != data.shape[1]:
+        raise ValueError("Every weight vector needs one weight per criterion.")
+
+    norm_data = normalize(point_set)
+    v = get_strategy_thresholds(strategy)
+
+    Q = np.empty((len(weights), len(data)))
+    chunk_size = max(1, memory_limit // (8 * max(data.size, 1)))
+    for start in range(0, len(weights), chunk_size):
+        chunk = weights[start : start + chunk_size]
+        S = chunk @ norm_data.T
+        R = (chunk[:, None, :] * norm_data[None, :, :]).max(axis=2)
+
+        S_min, S_max = S.min(axis=1, keepdims=True), S.max(axis=1, keepdims=True)
+        R_min, R_max = R.min(axis=1, keepdims=True), R.max(axis=1, keepdims=True)
+        S = (S - S_min) / (S_max - S_min + 1e-6)
+        R = (R - R_min) / (R_max - R_min + 1e-6)
+        Q[start : start + chunk_size] = v * S + (1 - v) * R
+
+    return np.argsort(-Q, axis=1), Q
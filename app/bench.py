@@ -0,0 +1,236 @@
+"""Benchmark grid runner, usage: python -m app.bench --help"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Sequence
+import numpy as np
+import pandas as pd
+from scipy import stats
+from app.algorithms.interface import (
+    DISTRIBUTIONS,
+    MEMORY_SAMPLES,
+    NAIVE_ALGORITHMS,
+    benchmark_grid,
+    run_grid,
+)
+
+BENCHMARK_COLUMNS: list[str] = [
+    "distribution",
+    "algorithm",
+    "dimensionality",
+    "cardinality",
+    "sorted",
+    "times",
+    "comparison_point_counter",
+    "comparison_coordinates_counter",
+]
+CONFIGURATION_COLUMNS: list[str] = BENCHMARK_COLUMNS[:5]
+
+
+def summarize(result: dict[str, any]) -> dict[str, any]:
+    """Row of benchmark.csv: mean time, comparison counts and memory usage of the repeats."""
+    row = {column: result[column] for column in CONFIGURATION_COLUMNS}
+    row["times"] = float(np.mean(result["times"]))
+    for column in ("comparison_point_counter", "comparison_coordinates_counter"):
+        row[column] = int(np.mean(result[column]))
+    for column in MEMORY_SAMPLES:
+        if column in result:
+            row[column] = int(np.mean(result[column]))
+    return row
+
+
+def _load_baseline(path: Path) -> pd.DataFrame:
+    """Baseline with a list of time samples per configuration.
+
+    A CSV baseline only holds mean times, a JSON baseline written by this tool
+    holds every repeat.
+    """
+    if path.suffix == ".json":
+        baseline = pd.DataFrame(json.loads(path.read_text()))
+    else:
+        baseline = pd.read_csv(path)
+        baseline["times"] = baseline["times"].map(lambda time: [time])
+    baseline["sorted"] = baseline["sorted"].astype(bool)
+    return baseline[BENCHMARK_COLUMNS[:6]]
+
+
+def find_slowdowns(
+    results: list[dict[str, any]], baseline: pd.DataFrame, alpha: float = 0.05
+) -> pd.DataFrame:
+    """Compares times of every configuration present in both runs.
+
+    With repeats on both sides Welch's t-test is used, against a single baseline
+    time the one-sample t-test. A configuration is flagged as a slowdown if it is
+    slower with p-value below alpha; fewer than 2 repeats can't be tested.
+    """
+    current = pd.DataFrame(results)[BENCHMARK_COLUMNS[:6]]
+    merged = current.merge(
+        baseline, on=CONFIGURATION_COLUMNS, suffixes=("", "_baseline")
+    )
+    rows = []
+    for _, row in merged.iterrows():
+        times = np.asarray(row["times"])
+        baseline_times = np.asarray(row["times_baseline"])
+        p_value = np.nan
+        if len(times) > 1 and len(baseline_times) > 1:
+            p_value = stats.ttest_ind(
+                times, baseline_times, equal_var=False, alternative="greater"
+            ).pvalue
+        elif len(times) > 1:
+            p_value = stats.ttest_1samp(
+                times, baseline_times[0], alternative="greater"
+            ).pvalue
+        rows.append(
+            {
+                **{column: row[column] for column in CONFIGURATION_COLUMNS},
+                "times": times.mean(),
+                "times_baseline": baseline_times.mean(),
+                "ratio": times.mean() / baseline_times.mean(),
+                "p_value": p_value,
+                "slowdown": bool(p_value < alpha),
+            }
+        )
+    return pd.DataFrame(
+        rows,
+        columns=CONFIGURATION_COLUMNS
+        + ["times", "times_baseline", "ratio", "p_value", "slowdown"],
+    )
+
+
+def _describe(result: dict[str, any]) -> str:
+    return ", ".join(f"{column}={result[column]}" for column in CONFIGURATION_COLUMNS)
+
+
+def _parse_flag(value: str) -> bool:
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise argparse.ArgumentTypeError(f"Expected true or false, got '{value}'.")
+
+
+def parse_arguments(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.bench", description="Benchmarks the naive algorithms."
+    )
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=list(DISTRIBUTIONS),
+        default=["uniform", "normal", "exponential", "poisson"],
+    )
+    parser.add_argument(
+        "--dimensionalities", nargs="+", type=int, default=[2, 3, 4, 5, 10]
+    )
+    parser.add_argument("--cardinalities", nargs="+", type=int, default=[100, 1000])
+    parser.add_argument(
+        "--sorted",
+        nargs="+",
+        type=_parse_flag,
+        default=[False, True],
+        dest="sorted_flags",
+        help="presort flags, datasets are sorted by the first criterion when true",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=list(NAIVE_ALGORITHMS),
+        default=list(NAIVE_ALGORITHMS),
+    )
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="unmeasured runs before the repeats"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="adds peak_memory, retained_memory and retained_allocations columns; "
+        "tracemalloc sees only live blocks, so the retained ones are the allocations "
+        "still alive after the run, not the cumulative ones",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="configurations run at once, defaults to the number of CPUs",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="seconds after which a configuration is killed and skipped",
+    )
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.csv"))
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="per repeat results, defaults to the output path with a .json suffix",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="baseline CSV (or JSON) to test the times against",
+    )
+    parser.add_argument("--alpha", type=float, default=0.05)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the grid, returns 1 if a slowdown against the baseline was found.
+
+    Results are written in the order the configurations complete.
+    """
+    arguments = parse_arguments(argv)
+    grid = benchmark_grid(
+        arguments.distributions,
+        arguments.dimensionalities,
+        arguments.cardinalities,
+        arguments.sorted_flags,
+        arguments.algorithms,
+        arguments.repeats,
+        arguments.seed,
+        arguments.warmup,
+        arguments.profile_memory,
+    )
+    results = []
+    # rows are written as configurations complete, so a killed run keeps them
+    with open(arguments.output, "w", newline="") as output:
+        columns = BENCHMARK_COLUMNS + (
+            list(MEMORY_SAMPLES) if arguments.profile_memory else []
+        )
+        writer = csv.DictWriter(output, fieldnames=columns)
+        writer.writeheader()
+        for result in run_grid(grid, arguments.workers, arguments.timeout):
+            if result["status"] != "ok":
+                print(
+                    f"Skipped {_describe(result)}: {result.get('error', result['status'])}",
+                    file=sys.stderr,
+                )
+                continue
+            writer.writerow(summarize(result))
+            output.flush()
+            results.append(result)
+    json_path = arguments.json or arguments.output.with_suffix(".json")
+    json_path.write_text(json.dumps(results, indent=2))
+
+    if arguments.compare is None:
+        return 0
+    comparison = find_slowdowns(
+        results, _load_baseline(arguments.compare), arguments.alpha
+    )
+    print(comparison.to_string(index=False))
+    slowdowns = comparison[comparison["slowdown"]]
+    print(
+        f"{len(slowdowns)} of {len(comparison)} configurations are significantly slower."
+    )
+    return int(len(slowdowns) > 0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,274 @@
+"""Empirical scaling report, usage: python -m app.complexity --help"""
+
+import argparse
+import time
+from functools import partial
+from pathlib import Path
+from typing import Sequence
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from scipy import stats
+from app.algorithms.interface import (
+    DISTRIBUTIONS,
+    NAIVE_ALGORITHMS,
+    RANKING_ALGORITHMS,
+    BenchmarkAnalyzer,
+    sweep_cardinalities,
+)
+from app.algorithms.rsm import reference_set_method
+
+METRICS: list[str] = [
+    "times",
+    "comparison_point_counter",
+    "comparison_coordinates_counter",
+]
+
+
+def cardinality_ladder(
+    start: int = 100, stop: int = 12_800, factor: float = 2
+) -> list[int]:
+    """Geometric sequence of cardinalities from start up to stop."""
+    ladder = [start]
+    while ladder[-1] * factor <= stop:
+        ladder.append(int(round(ladder[-1] * factor)))
+    return ladder
+
+
+def _ranking_method(name: str, dimensionality: int):
+    if RANKING_ALGORITHMS[name] is reference_set_method:
+        # RSM needs reference sets, the corners of the normalised space will do
+        return partial(
+            reference_set_method,
+            ideal_points_set=np.zeros((1, dimensionality)),
+            status_quo_points_set=np.ones((1, dimensionality)),
+        )
+    return RANKING_ALGORITHMS[name]
+
+
+def _measure(
+    algorithm: str, dimensionality: int, dataset: list, repeats: int
+) -> dict[str, float]:
+    if algorithm in NAIVE_ALGORITHMS:
+        benchmark = BenchmarkAnalyzer(algorithm, dimensionality, dataset)
+        result = benchmark.run_algorithm(repeats)
+        return {metric: float(np.mean(result[metric])) for metric in METRICS}
+    method = _ranking_method(algorithm, dimensionality)
+    weights = np.full(dimensionality, 1 / dimensionality)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        method(dataset, weights)
+        times.append(time.perf_counter() - start)
+    # ranking methods work on arrays, they don't compare points
+    return {"times": float(np.mean(times))}
+
+
+def measure_scaling(
+    algorithms: list[str],
+    distributions: list[str],
+    dimensionalities: list[int],
+    cardinalities: list[int],
+    repeats: int = 1,
+    seed: int = 0,
+    time_budget: float = 10.0,
+) -> pd.DataFrame:
+    """Mean time and comparison counts of every algorithm on the cardinality ladder.
+
+    An algorithm leaves the ladder of a distribution and dimensionality once its
+    mean time exceeds time_budget seconds, like in sweep_cardinalities.
+    """
+    rows = []
+    rng = np.random.default_rng(seed)
+    for distribution in distributions:
+        for dimensionality in dimensionalities:
+
+            def measure(algorithm: str, dataset: list) -> tuple[dict, float]:
+                measured = _measure(algorithm, dimensionality, dataset, repeats)
+                row = {
+                    "distribution": distribution,
+                    "dimensionality": dimensionality,
+                    "algorithm": algorithm,
+                    "cardinality": len(dataset),
+                    **measured,
+                }
+                return row, measured["times"]
+
+            rows += sweep_cardinalities(
+                algorithms,
+                distribution,
+                dimensionality,
+                cardinalities,
+                measure,
+                time_budget,
+                rng,
+            )
+    return pd.DataFrame(
+        rows,
+        columns=["distribution", "dimensionality", "algorithm", "cardinality"]
+        + METRICS,
+    )
+
+
+def fit_power_law(
+    cardinalities: np.ndarray, values: np.ndarray, confidence: float = 0.95
+) -> dict[str, float]:
+    """Fits values ~ c * n^k on the log-log scale, with a confidence interval of k."""
+    log_n, log_y = np.log(cardinalities), np.log(values)
+    fit = stats.linregress(log_n, log_y)
+    margin = np.nan
+    if len(log_n) > 2:
+        margin = stats.t.ppf((1 + confidence) / 2, len(log_n) - 2) * fit.stderr
+    residuals = log_y - (fit.intercept + fit.slope * log_n)
+    return {
+        "exponent": fit.slope,
+        "exponent_low": fit.slope - margin,
+        "exponent_high": fit.slope + margin,
+        "power_law_error": float(np.sqrt(np.mean(residuals**2))),
+    }
+
+
+def fit_n_log_n(cardinalities: np.ndarray, values: np.ndarray) -> dict[str, float]:
+    """Fits values ~ c * n log n, the error is the RMS of log residuals like in fit_power_law."""
+    model = cardinalities * np.log(cardinalities)
+    # least squares of log(values) - log(c * model) over log(c)
+    log_c = np.mean(np.log(values) - np.log(model))
+    residuals = np.log(values) - (log_c + np.log(model))
+    return {
+        "n_log_n_coefficient": float(np.exp(log_c)),
+        "n_log_n_error": float(np.sqrt(np.mean(residuals**2))),
+    }
+
+
+def fit_scaling(measurements: pd.DataFrame, confidence: float = 0.95) -> pd.DataFrame:
+    """Scaling models of every metric per distribution, dimensionality and algorithm.
+
+    Series with fewer than 3 cardinalities or non-positive values aren't fitted.
+    """
+    rows = []
+    groups = measurements.groupby(
+        ["distribution", "dimensionality", "algorithm"], sort=False
+    )
+    for (distribution, dimensionality, algorithm), group in groups:
+        for metric in METRICS:
+            series = group[["cardinality", metric]].dropna()
+            series = series[series[metric] > 0]
+            if len(series) < 3:
+                continue
+            n = series["cardinality"].to_numpy(dtype=float)
+            values = series[metric].to_numpy(dtype=float)
+            rows.append(
+                {
+                    "distribution": distribution,
+                    "dimensionality": dimensionality,
+                    "algorithm": algorithm,
+                    "metric": metric,
+                    "points": len(series),
+                    **fit_power_law(n, values, confidence),
+                    **fit_n_log_n(n, values),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def plot_scaling(measurements: pd.DataFrame, output_dir: Path) -> list[Path]:
+    """Log-log plots of every metric, one figure per distribution and dimensionality."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for (distribution, dimensionality), group in measurements.groupby(
+        ["distribution", "dimensionality"], sort=False
+    ):
+        figure, axes = plt.subplots(1, len(METRICS), figsize=(6 * len(METRICS), 5))
+        for axis, metric in zip(axes, METRICS):
+            for algorithm, series in group.groupby("algorithm", sort=False):
+                series = series[series[metric] > 0]
+                if len(series):
+                    axis.loglog(
+                        series["cardinality"], series[metric], "o-", label=algorithm
+                    )
+            axis.set_xlabel("cardinality")
+            axis.set_ylabel(metric)
+            axis.grid(True, which="both", alpha=0.3)
+        axes[0].legend()
+        figure.suptitle(f"{distribution}, dimensionality {dimensionality}")
+        path = output_dir / f"scaling_{distribution}_{dimensionality}d.png"
+        figure.savefig(path, bbox_inches="tight")
+        plt.close(figure)
+        paths.append(path)
+    return paths
+
+
+def parse_arguments(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.complexity",
+        description="Fits how time and comparison counts of the algorithms scale with n.",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=list(NAIVE_ALGORITHMS) + list(RANKING_ALGORITHMS),
+        default=list(NAIVE_ALGORITHMS) + list(RANKING_ALGORITHMS),
+    )
+    parser.add_argument(
+        "--distributions", nargs="+", choices=list(DISTRIBUTIONS), default=["uniform"]
+    )
+    parser.add_argument("--dimensionalities", nargs="+", type=int, default=[2, 3, 5])
+    parser.add_argument("--start", type=int, default=100)
+    parser.add_argument("--stop", type=int, default=12_800)
+    parser.add_argument("--factor", type=float, default=2)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=10.0,
+        help="seconds, slower algorithms leave the ladder",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--output-dir", type=Path, default=Path("complexity_report"))
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    # the report is only saved to files, no display is needed
+    matplotlib.use("Agg")
+    arguments = parse_arguments(argv)
+    measurements = measure_scaling(
+        arguments.algorithms,
+        arguments.distributions,
+        arguments.dimensionalities,
+        cardinality_ladder(arguments.start, arguments.stop, arguments.factor),
+        arguments.repeats,
+        arguments.seed,
+        arguments.time_budget,
+    )
+    fits = fit_scaling(measurements, arguments.confidence)
+
+    arguments.output_dir.mkdir(parents=True, exist_ok=True)
+    measurements.to_csv(arguments.output_dir / "measurements.csv", index=False)
+    fits.to_csv(arguments.output_dir / "fits.csv", index=False)
+    plot_scaling(measurements, arguments.output_dir)
+
+    if fits.empty:
+        print("Every series needs at least 3 cardinalities to be fitted.")
+        return
+    columns = [
+        "exponent",
+        "exponent_low",
+        "exponent_high",
+        "power_law_error",
+        "n_log_n_error",
+    ]
+    with pd.option_context("display.width", 200, "display.max_rows", None):
+        print(
+            fits.to_string(
+                index=False,
+                columns=fits.columns[:5].tolist() + columns,
+                float_format="%.3f",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -55,15 +55,20 @@ class CriteriaPresenter:
     def add_column(self) -> None:
         default_column_name = self.get_default_new_criteria_name()
         default_column_values = np.zeros(self.model.data.shape[0])
-        self.model.labels.append(default_column_name)
-        self.model.directions.append("Min")
+        # new lists, so the model sees every change through its setters
+        self.model.labels = self.model.labels + [default_column_name]
+        self.model.directions = self.model.directions + ["Min"]
         self.model.data = np.column_stack((self.model.data, default_column_values))
 
     def remove_column(self, column_name: str) -> None:
         if column_name in self.model.labels:
             idx = self.model.labels.index(column_name)
-            self.model.directions.pop(idx)
-            self.model.labels.pop(idx)
+            self.model.directions = [
+                d for i, d in enumerate(self.model.directions) if i != idx
+            ]
+            self.model.labels = [
+                label for i, label in enumerate(self.model.labels) if i != idx
+            ]
             self.model.data = np.delete(self.model.data, idx, axis=1)
 
     def update_model(self, updated: pd.DataFrame) -> None:
@@ -31,20 +31,27 @@ class Model(Protocol):
     def ranking(self) -> Ranking:
         ...
 
+    @property
+    def rankings(self) -> dict[str, Ranking]:
+        ...
+
 
 BuildDataframeFn = Callable[[Model], pd.DataFrame]
 
+# only the first rows are copied into the table, the rest of (memory-mapped) data stays untouched
+PREVIEW_ROWS: int = 1000
+
 
 def build_data_table_view_df(model: Model) -> pd.DataFrame:
-    df = pd.DataFrame(model.data)
+    df = pd.DataFrame(model.data[:PREVIEW_ROWS])
     df.columns = model.labels
     return df
 
 
 def build_alternatives_table_view_df(model: Model) -> pd.DataFrame:
-    df = pd.DataFrame(model.data)
+    df = pd.DataFrame(model.data[:PREVIEW_ROWS])
     df.columns = model.labels
-    df.insert(0, "Nazwa alternatywy", model.alternative_names)
+    df.insert(0, "Nazwa alternatywy", model.alternative_names[:PREVIEW_ROWS])
     return df
 
 
@@ -66,6 +73,19 @@ def build_ranking_table_view_df(model: Model) -> pd.DataFrame:
     return df
 
 
+def build_rankings_comparison_table_view_df(model: Model) -> pd.DataFrame:
+    try:
+        rankings = model.rankings
+    except PropertyNotReadyError:
+        return pd.DataFrame([])
+    df = pd.DataFrame()
+    for name, (indices, scores) in rankings.items():
+        df[name] = [model.alternative_names[i] for i in indices]
+        df[f"{name} - wynik"] = scores
+    df.index = pd.RangeIndex(1, len(df) + 1, name="Pozycja")
+    return df
+
+
 class DataTablePresenter:
     def __init__(
         self, model: Model, view: "DataTableView", build_df: BuildDataframeFn
@@ -1,9 +1,16 @@
 from typing import Protocol, TextIO
 from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+import json
+import os
 import streamlit as st
 import numpy as np
 import pandas as pd
 
+# the only directory datasets can be loaded from by their path on the server
+DATA_DIRECTORY: Path = Path("datasets")
+
 
 class Model(Protocol):
     @property
@@ -122,6 +129,92 @@ class ExcelDatasetLoader:
         model.criteria_weights = criteria_weights
 
 
+@dataclass
+class BinaryDatasetLoader:
+    datapoints: np.ndarray = field(init=False, default=None)
+    metadata: dict = field(init=False, default_factory=dict)
+
+    def help(self) -> str:
+        with open("help/BinaryLoader.md", encoding="utf-8") as md:
+            return "".join(md.readlines())
+
+    def read(self, file: str | os.PathLike) -> None:
+        path = Path(file)
+        if path.suffix == ".npz":
+            # archives can't be memory-mapped, the payload is read eagerly
+            with np.load(path) as archive:
+                self.datapoints = archive["data"]
+        else:
+            self.datapoints = np.load(path, mmap_mode="r")
+        with open(path.with_suffix(".json"), encoding="utf-8") as sidecar:
+            self.metadata = json.load(sidecar)
+
+    def populate_model(self, model: Model) -> None:
+        criteria_count = self.datapoints.shape[1]
+        for key in ("directions", "labels", "weights"):
+            if key in self.metadata and len(self.metadata[key]) != criteria_count:
+                raise ValueError(
+                    f"The sidecar has {len(self.metadata[key])} {key} "
+                    f"for {criteria_count} criteria."
+                )
+        model.data = self.datapoints
+        model.directions = self.metadata.get("directions", ["Min"] * criteria_count)
+        model.labels = self.metadata.get(
+            "labels", [f"Kryterium {i + 1}" for i in range(criteria_count)]
+        )
+        if "weights" in self.metadata:
+            model.criteria_weights = self.metadata["weights"]
+
+
+def resolve_dataset_path(
+    file: str | os.PathLike, data_directory: str | os.PathLike = DATA_DIRECTORY
+) -> Path:
+    """Path of a dataset relative to the data directory, which it can't leave."""
+    directory = Path(data_directory).resolve()
+    path = (directory / file).resolve()
+    if not path.is_relative_to(directory):
+        raise ValueError(f"'{file}' is outside of the data directory '{data_directory}'.")
+    return path
+
+
+def save_binary_dataset(
+    file: str | os.PathLike,
+    data: np.ndarray,
+    labels: list[str],
+    directions: list[str],
+    criteria_weights: list[float] | None = None,
+) -> None:
+    """Writes the data as a .npy payload with a JSON sidecar next to it."""
+    path = Path(file).with_suffix(".npy")
+    np.save(path, np.ascontiguousarray(data, dtype=float))
+    metadata = {"labels": list(labels), "directions": list(directions)}
+    if criteria_weights is not None:
+        metadata["weights"] = [float(w) for w in criteria_weights]
+    with open(path.with_suffix(".json"), "w", encoding="utf-8") as sidecar:
+        json.dump(metadata, sidecar, ensure_ascii=False, indent=2)
+
+
+def convert_to_binary_dataset(
+    source: str | os.PathLike, destination: str | os.PathLike
+) -> None:
+    """Converts a CSV or XLSX dataset into the binary format."""
+    loaders = {".csv": CSVDatasetLoader, ".xlsx": ExcelDatasetLoader}
+    suffix = Path(source).suffix.lower()
+    if suffix not in loaders:
+        raise ValueError(f"Unsupported dataset format '{suffix}'; expected .csv or .xlsx.")
+    loader = loaders[suffix]()
+    loader.read(source)
+    dataset = SimpleNamespace(criteria_weights=None)
+    loader.populate_model(dataset)
+    save_binary_dataset(
+        destination,
+        dataset.data,
+        dataset.labels,
+        dataset.directions,
+        dataset.criteria_weights,
+    )
+
+
 class DatasetLoaderPresenter:
     def __init__(
         self, model: Model, view: "DatasetLoaderView", loader: DatasetLoaderStrategy
@@ -159,3 +252,27 @@ class DatasetLoaderView:
 
     def get_current_uploaded_file(self) -> str:
         return st.session_state.get("current_uploaded_file", "")
+
+
+class DatasetPathLoaderView:
+    """Loads datasets from the server's data directory, so they can be memory-mapped instead of uploaded."""
+
+    def __init__(
+        self, title: str, data_directory: str | os.PathLike = DATA_DIRECTORY
+    ) -> None:
+        self.title = title
+        self.data_directory = data_directory
+
+    def init_ui(self, presenter: DatasetLoaderPresenter) -> None:
+        st.subheader(self.title, divider=True)
+        path = st.text_input(
+            f"Ścieżka do pliku z danymi w katalogu {self.data_directory}",
+            help=presenter.loader.help(),
+        )
+        if st.button("Wczytaj") and path:
+            try:
+                presenter.save_data_to_model(
+                    resolve_dataset_path(path, self.data_directory)
+                )
+            except (OSError, ValueError) as error:
+                st.error(f"Nie udało się wczytać zbioru danych: {error}")
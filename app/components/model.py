@@ -1,7 +1,24 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Hashable
 import numpy as np
 import streamlit as st
 from ..algorithms.point import Point, create_points_from_datapoints
-from ..algorithms.types import OWDAlgorithm, RankingMethod, Ranking
+from ..algorithms.point_set import PointSet, direction_signs, index_algorithm
+from ..algorithms.sweep import SWEEP_ALGORITHMS
+from ..algorithms.archive import ParetoArchive
+from ..algorithms.non_dominated_sorting import fast_non_dominated_sort
+from ..algorithms.sensitivity import rank_acceptability
+from .timing import span
+from ..algorithms.types import (
+    OWDAlgorithm,
+    VectorizedOWDAlgorithm,
+    RankingMethod,
+    Ranking,
+    NonDominatedSorting,
+)
 
 
 class PropertyNotReadyError(Exception):
@@ -13,6 +30,73 @@ class PropertyNotReadyError(Exception):
         return self.message
 
 
+# fields of Model every derived state entry is computed from
+DERIVED_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "points": ("data",),
+    "front": ("data", "directions"),
+    "layers": ("data", "directions"),
+    "ranking": ("data", "directions", "criteria_weights"),
+    "rankings": ("data", "directions", "criteria_weights"),
+    # weights are sampled, so the analysis doesn't depend on criteria_weights
+    "acceptability": ("data", "directions"),
+}
+
+
+def _mapped_file(array: np.ndarray) -> tuple | None:
+    """File, modification time and position of an array backed by a memory-mapped file."""
+    memmap = array
+    while not isinstance(memmap, np.memmap):
+        if not isinstance(memmap.base, np.ndarray):
+            return None
+        memmap = memmap.base
+    if memmap.filename is None:
+        return None
+    root = memmap
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    # views of one mapping differ by where they start and how they step through it
+    position = array.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+    return (
+        memmap.filename,
+        os.stat(memmap.filename).st_mtime_ns,
+        memmap.offset,
+        position,
+        array.strides,
+    )
+
+
+def _fingerprint(value: Any) -> str:
+    """Content hash of an array or of a plain value by its repr.
+
+    A memory-mapped array is identified by its file instead, so it isn't read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    mapped_file = _mapped_file(value) if isinstance(value, np.ndarray) else None
+    if mapped_file is not None:
+        digest.update(f"{value.dtype.str}{value.shape}{mapped_file}".encode())
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        array = np.ascontiguousarray(value)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.reshape(-1).view(np.uint8))
+    elif isinstance(value, np.ndarray):
+        # repr of a large array is truncated, so the elements are listed in full
+        digest.update(f"{value.shape}{value.tolist()!r}".encode())
+    else:
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def _callable_key(function: Callable) -> Hashable:
+    """Identifies a function, a partial also by the fingerprints of its arguments."""
+    if isinstance(function, partial):
+        return (
+            _callable_key(function.func),
+            tuple(_fingerprint(arg) for arg in function.args),
+            tuple((k, _fingerprint(v)) for k, v in sorted(function.keywords.items())),
+        )
+    return f"{function.__module__}.{function.__qualname__}"
+
+
 class Model:
 
     def __init__(self, streamlit_indentifier: str) -> None:
@@ -22,8 +106,12 @@ class Model:
         self._data: np.ndarray = np.random.normal(0, 1, size=(20, 2))
         self._labels: list[str] = ["x", "y"]
         self._directions: list[str] = ["Min", "Max"]
-        self._dominated_points: list[Point] = None
-        self._non_dominated_points: list[Point] = None
+        # rows of data on the Pareto front
+        self._non_dominated_mask: np.ndarray = None
+        self._layers: np.ndarray = None
+        # kept in sync with data, so small edits don't require a full recompute
+        self._archive: ParetoArchive | None = None
+        self._archive_ids: np.ndarray | None = None
 
         # fields used by ranking methods
         self._alternative_names: list[str] = [f"alt{i}" for i in range(20)]
@@ -31,13 +119,25 @@ class Model:
         self._class_data: np.ndarray = np.random.normal(0, 1, size=(3, 2))
         self._criteria_weights: list[float] = [0.5, 0.5]
         self._ranking: Ranking = None
+        # rankings of every method run at once, by method name
+        self._rankings: dict[str, Ranking] | None = None
+        # rows of the front and their rank acceptability indices
+        self._acceptability: tuple[np.ndarray, np.ndarray] | None = None
+
+        # derived state survives reruns as long as the fingerprints of its fields match
+        self._fingerprints: dict[str, str] = {
+            "data": _fingerprint(self._data),
+            "directions": _fingerprint(self._directions),
+            "criteria_weights": _fingerprint(self._criteria_weights),
+        }
+        self._derived: dict[tuple, Any] = {}
 
         if self.streamlit_indentifier not in st.session_state:
             st.session_state[self.streamlit_indentifier] = self
 
     @property
     def points(self) -> list[Point]:
-        return create_points_from_datapoints(self._data)
+        return self._cached("points", lambda: create_points_from_datapoints(self._data))
 
     @property
     def data(self) -> np.ndarray:
@@ -45,9 +145,30 @@ class Model:
 
     @data.setter
     def data(self, data: np.ndarray) -> None:
+        previous = self._data
         self._data = data
+        if self._update_fingerprint("data", data):
+            self._update_archive(previous)
         self.checkpoint()
 
+    @property
+    def signs(self) -> np.ndarray:
+        """+1 for minimised and -1 for maximised criteria, from the current directions."""
+        signs = direction_signs(self._directions)
+        if len(signs) != self._data.shape[1]:
+            raise ValueError(
+                f"There are {len(signs)} directions for {self._data.shape[1]} criteria."
+            )
+        return signs
+
+    @property
+    def signed_data(self) -> np.ndarray:
+        """Data with every criterion turned into a minimised one, the data itself if all are."""
+        signs = self.signs
+        if np.all(signs > 0):
+            return self._data
+        return self._data * signs
+
     @property
     def labels(self) -> list[str]:
         return self._labels
@@ -66,6 +187,7 @@ class Model:
         if sum(criteria_weights) > 1.0:
             raise ValueError("The criteria weights vector has to be normalized!")
         self._criteria_weights = criteria_weights
+        self._update_fingerprint("criteria_weights", criteria_weights)
         self.checkpoint()
 
     @property
@@ -75,23 +197,44 @@ class Model:
     @directions.setter
     def directions(self, directions: list[str]) -> None:
         self._directions = directions
+        if self._update_fingerprint("directions", directions):
+            # the signs of whole columns change, nothing in the archive stays valid
+            self._archive = None
         self.checkpoint()
 
     @property
-    def dominated_points(self) -> list[Point]:
-        if self._dominated_points is None:
+    def non_dominated_mask(self) -> np.ndarray:
+        if self._non_dominated_mask is None:
             raise PropertyNotReadyError(
-                "dominated_points", "process_points_with_naive_algorithm"
+                "non_dominated_mask", "process_points_with_naive_algorithm"
             )
-        return self._dominated_points
+        return self._non_dominated_mask
+
+    @property
+    def non_dominated_data(self) -> np.ndarray:
+        return self._data[self.non_dominated_mask]
 
     @property
-    def non_dominated_points(self) -> list[Point]:
-        if self._dominated_points is None:
+    def dominated_data(self) -> np.ndarray:
+        return self._data[~self.non_dominated_mask]
+
+    @property
+    def layers(self) -> np.ndarray:
+        if self._layers is None:
             raise PropertyNotReadyError(
-                "non_dominated_points", "process_points_with_naive_algorithm"
+                "layers", "process_points_with_non_dominated_sorting"
+            )
+        return self._layers
+
+    @property
+    def pareto_archive(self) -> ParetoArchive:
+        if self._archive is None:
+            signed = self.signed_data
+            self._archive = ParetoArchive(self._data.shape[1], capacity=max(len(signed), 1))
+            self._archive_ids = np.array(
+                [self._archive.insert(row) for row in signed], dtype=np.int64
             )
-        return self._non_dominated_points
+        return self._archive
 
     @property
     def class_names(self) -> list[str]:
@@ -126,33 +269,210 @@ class Model:
             raise PropertyNotReadyError("ranking", "process_points_with_ranking_method")
         return self._ranking
 
+    @property
+    def rankings(self) -> dict[str, Ranking]:
+        if self._rankings is None:
+            raise PropertyNotReadyError(
+                "rankings", "process_points_with_ranking_methods"
+            )
+        return self._rankings
+
+    @property
+    def acceptability(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._acceptability is None:
+            raise PropertyNotReadyError(
+                "acceptability", "process_points_with_sensitivity_analysis"
+            )
+        return self._acceptability
+
     def process_points_with_naive_algorithm(self, algorithm: OWDAlgorithm) -> None:
-        points = self.points
-        # flip the signs for optimisation
-        for p in points:
-            p.adjust_signs_for_optimization(self.directions)
-        non_dominated = algorithm(points)
-        # bring back the previous values
-        for p in non_dominated:
-            p.adjust_signs_for_optimization(self.directions)
-        self._non_dominated_points = non_dominated
-        self._dominated_points = self._filter_non_dominated(non_dominated)
+        # 2/3 criteria are dispatched to the O(n log n) sweep-line engines
+        self.process_points_with_vectorized_algorithm(index_algorithm(algorithm))
+
+    def process_points_with_vectorized_algorithm(
+        self, algorithm: VectorizedOWDAlgorithm, exact: bool = True
+    ) -> None:
+        # every selected algorithm gets its own entry, so choosing another one runs it
+        key = _callable_key(algorithm)
+        if exact:
+            # the front is the same, but 2/3 criteria have O(n log n) sweep-line engines
+            algorithm = SWEEP_ALGORITHMS.get(len(self.labels), algorithm)
+
+        def compute_front() -> np.ndarray:
+            with span("algorithm"):
+                non_dominated_indices = algorithm(PointSet(self.signed_data))
+            is_non_dominated = np.zeros(len(self._data), dtype=bool)
+            is_non_dominated[non_dominated_indices] = True
+            return is_non_dominated
+
+        self._non_dominated_mask = self._cached("front", compute_front, extra=key)
+        self.checkpoint()
+
+    def process_points_with_archive(self) -> None:
+        with span("archive"):
+            is_non_dominated = self.pareto_archive.is_non_dominated(self._archive_ids)
+        self._non_dominated_mask = is_non_dominated
+        self.checkpoint()
+
+    def process_points_with_non_dominated_sorting(
+        self, sorting: NonDominatedSorting = fast_non_dominated_sort
+    ) -> None:
+
+        def compute_layers() -> np.ndarray:
+            with span("non-dominated sorting"):
+                return sorting(PointSet(self.signed_data))
+
+        self._layers = self._cached("layers", compute_layers)
         self.checkpoint()
 
     def process_points_with_ranking_method(self, algorithm: RankingMethod) -> None:
-        # flip the signs for optimisation
-        for p in self.non_dominated_points:
-            p.adjust_signs_for_optimization(self.directions)
-        ranking = algorithm(self.non_dominated_points, self.criteria_weights)
-        self._ranking = ranking
+        is_non_dominated = self.non_dominated_mask
+
+        def compute_ranking() -> Ranking:
+            front = np.flatnonzero(is_non_dominated)
+            # the methods rank minimised criteria, positions within the front map back to rows
+            indices, scores = algorithm(
+                PointSet(self.signed_data[front]),
+                self.criteria_weights,
+            )
+            return front[indices].tolist(), scores
+
+        self._ranking = self._cached(
+            "ranking",
+            compute_ranking,
+            extra=(_callable_key(algorithm), _fingerprint(is_non_dominated)),
+        )
+        self.checkpoint()
+
+    def process_points_with_ranking_methods(
+        self, algorithms: dict[str, RankingMethod]
+    ) -> None:
+        is_non_dominated = self.non_dominated_mask
+
+        def compute_rankings() -> dict[str, Ranking]:
+            front = np.flatnonzero(is_non_dominated)
+            # the methods share the matrix of the front and its column statistics
+            front_points = PointSet(self.signed_data[front])
+            # NumPy releases the GIL in the heavy parts of the methods
+            executor = ThreadPoolExecutor(max(len(algorithms), 1))
+            with span("ranking methods"), executor:
+                futures = {
+                    name: executor.submit(algorithm, front_points, self.criteria_weights)
+                    for name, algorithm in algorithms.items()
+                }
+                rankings = {name: future.result() for name, future in futures.items()}
+            return {
+                name: (front[indices].tolist(), scores)
+                for name, (indices, scores) in rankings.items()
+            }
+
+        self._rankings = self._cached(
+            "rankings",
+            compute_rankings,
+            extra=(
+                tuple((name, _callable_key(a)) for name, a in algorithms.items()),
+                _fingerprint(is_non_dominated),
+            ),
+        )
+        self.checkpoint()
+
+    def process_points_with_sensitivity_analysis(
+        self,
+        method: str,
+        samples: int = 1000,
+        seed: int = 0,
+        box: tuple[np.ndarray, np.ndarray] | None = None,
+        options: dict[str, Any] | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """Rank acceptability of the front, on all the CPUs unless workers are given.
+
+        The result doesn't depend on the number of workers, so it isn't a part of the key.
+        """
+        is_non_dominated = self.non_dominated_mask
+
+        def compute_acceptability() -> tuple[np.ndarray, np.ndarray]:
+            front = np.flatnonzero(is_non_dominated)
+            with span("sensitivity analysis"):
+                acceptability = rank_acceptability(
+                    self.signed_data[front],
+                    method,
+                    samples,
+                    seed,
+                    box,
+                    workers=workers or os.cpu_count(),
+                    options=options,
+                )
+            return front, acceptability
+
+        self._acceptability = self._cached(
+            "acceptability",
+            compute_acceptability,
+            extra=(
+                method,
+                samples,
+                seed,
+                _fingerprint(None if box is None else np.asarray(box, dtype=float)),
+                tuple((k, _fingerprint(v)) for k, v in sorted((options or {}).items())),
+                _fingerprint(is_non_dominated),
+            ),
+        )
         self.checkpoint()
 
-    def _filter_non_dominated(self, non_dominated: list[Point]) -> list[Point]:
-        dominated = []
-        for p in self.points:
-            if p not in non_dominated:
-                dominated.append(p)
-        return dominated
+    def _cached(self, name: str, compute: Callable[[], Any], extra: Hashable = None) -> Any:
+        """Derived state entry, recomputed only if a field it depends on has changed."""
+        key = (name, extra) + tuple(
+            self._fingerprints[field] for field in DERIVED_DEPENDENCIES[name]
+        )
+        if key not in self._derived:
+            self._derived[key] = compute()
+        return self._derived[key]
+
+    def _update_fingerprint(self, field: str, value: Any) -> bool:
+        """Drops the entries depending on the field if its content changed, returns whether it did."""
+        fingerprint = _fingerprint(value)
+        if fingerprint == self._fingerprints[field]:
+            return False
+        self._fingerprints[field] = fingerprint
+        self._derived = {
+            key: entry
+            for key, entry in self._derived.items()
+            if field not in DERIVED_DEPENDENCIES[key[0]]
+        }
+        return True
+
+    def _update_archive(self, previous: np.ndarray) -> None:
+        """Replays the difference between the previous and the current data on the archive."""
+        if self._archive is None:
+            return
+        # data edited in place and assigned back leaves no difference to replay
+        if (
+            np.may_share_memory(previous, self._data)
+            or previous.ndim != 2
+            or self._data.shape[1] != previous.shape[1]
+        ):
+            self._archive = None
+            return
+        common = min(len(previous), len(self._data))
+        changed = np.flatnonzero(
+            np.any(previous[:common] != self._data[:common], axis=1)
+        )
+        if len(changed) > common // 2:
+            # rebuilding from scratch is cheaper than replaying that many edits
+            self._archive = None
+            return
+
+        signs = self.signs
+        ids = self._archive_ids[: len(self._data)].copy()
+        for i in changed:
+            self._archive.remove(ids[i])
+            ids[i] = self._archive.insert(self._data[i] * signs)
+        for point_id in self._archive_ids[len(self._data) :]:
+            self._archive.remove(point_id)
+        appended = [
+            self._archive.insert(row) for row in self._data[common:] * signs
+        ]
+        self._archive_ids = np.concatenate([ids, np.array(appended, dtype=np.int64)])
 
     def checkpoint(self) -> None:
         """Save the current state of the data model, since Streamlit is stateless by design."""
@@ -1,28 +1,41 @@
 from typing import Any
+from functools import partial
 import pandas as pd
 import streamlit as st
 from matplotlib.figure import Figure
 import plotly.graph_objects as go
-from numpy import mean
+from numpy import mean, ndarray
+from .timing import Timeline, span
 from ..algorithms.interface import (
     Point,
     OWDAlgorithm,
+    VectorizedOWDAlgorithm,
     NAIVE_ALGORITHMS,
+    VECTORIZED_NAIVE_ALGORITHMS,
+    APPROXIMATE_NAIVE_ALGORITHMS,
     BenchmarkAnalyzer,
 )
 
 
 class Model:
+    @property
+    def data(self) -> ndarray:
+        ...
+
     @property
     def labels(self) -> list[str]:
         ...
 
     @property
-    def dominated_points(self) -> list[Point]:
+    def layers(self) -> ndarray:
         ...
 
     @property
-    def non_dominated_points(self) -> list[Point]:
+    def dominated_data(self) -> ndarray:
+        ...
+
+    @property
+    def non_dominated_data(self) -> ndarray:
         ...
 
     @property
@@ -32,57 +45,107 @@ class Model:
     def process_points_with_naive_algorithm(self, algorithm: OWDAlgorithm) -> None:
         ...
 
+    def process_points_with_vectorized_algorithm(
+        self, algorithm: VectorizedOWDAlgorithm, exact: bool = True
+    ) -> None:
+        ...
+
+    def process_points_with_archive(self) -> None:
+        ...
+
+    def process_points_with_non_dominated_sorting(self) -> None:
+        ...
+
 
-def point_to_json(p: Point, labels: list[str]) -> dict[str, Any]:
-    return {labels[i]: p.x[i] for i in range(len(labels))}
+def row_to_json(row: ndarray, labels: list[str]) -> dict[str, Any]:
+    return dict(zip(labels, row.tolist()))
 
 
 class NaiveActionMenuPresenter:
     cached_figure = "cached_figure"
     cached_json = "cached_json"
     cached_table = "cached_table"
+    cached_timeline = "cached_timeline"
 
     def __init__(self, model: Model, view: "NaiveActionMenuView") -> None:
         self.model = model
         self.view = view
         self.supported_algorithms = NAIVE_ALGORITHMS
+        self.vectorized_algorithms = VECTORIZED_NAIVE_ALGORITHMS
+        self.approximate_algorithms = APPROXIMATE_NAIVE_ALGORITHMS
         self.view.init_ui(self)
 
     def run_algorithm(self) -> None:
-        self.execute_the_algorithm(self.view.selected_algorithm)
-        self.prepare_results_json()
-        self.prepare_proper_figure()
+        with Timeline(enabled=self.view.measure_stages) as timeline:
+            if self.view.use_incremental_archive:
+                self.model.process_points_with_archive()
+                self.clear_cache()
+            else:
+                self.execute_the_algorithm(self.view.selected_algorithm)
+            with span("results json"):
+                self.prepare_results_json()
+            with span("figure"):
+                self.prepare_proper_figure()
+        if timeline.enabled:
+            st.session_state[self.cached_timeline] = timeline.breakdown()
+            timeline.log(
+                algorithm=self.view.selected_algorithm,
+                cardinality=len(self.model.data),
+                dimensionality=len(self.model.labels),
+            )
 
     def run_benchmark(self) -> None:
         self.execute_the_algorithm(self.view.selected_algorithm)
         self.prepare_proper_figure()
         self.prepare_benchmark_table(
-            len(self.model.labels), self.model.points, self.view.repeats_for_benchmark
+            len(self.model.labels),
+            self.model.points,
+            self.view.repeats_for_benchmark,
+            self.view.profile_memory,
         )
 
     def prepare_results_json(self) -> None:
         labels = self.model.labels
         json = {
             "nondominated": [
-                point_to_json(p, labels) for p in self.model.non_dominated_points
-            ],
-            "dominated": [
-                point_to_json(p, labels) for p in self.model.dominated_points
+                row_to_json(row, labels) for row in self.model.non_dominated_data
             ],
+            "dominated": [row_to_json(row, labels) for row in self.model.dominated_data],
         }
         st.session_state[self.cached_json] = json
 
+    def get_algorithm_names(self) -> list[str]:
+        return list(self.supported_algorithms) + list(self.approximate_algorithms)
+
+    def is_approximate(self, algorithm: str) -> bool:
+        return algorithm in self.approximate_algorithms
+
     def execute_the_algorithm(self, algorithm: str) -> None:
-        chosen_algorithm = self.supported_algorithms[algorithm]
-        self.model.process_points_with_naive_algorithm(chosen_algorithm)
+        if self.is_approximate(algorithm):
+            chosen_algorithm = partial(
+                self.approximate_algorithms[algorithm],
+                epsilon=self.view.epsilon,
+                relative=self.view.is_epsilon_relative,
+            )
+            self.model.process_points_with_vectorized_algorithm(
+                chosen_algorithm, exact=False
+            )
+        elif algorithm in self.vectorized_algorithms:
+            chosen_algorithm = self.vectorized_algorithms[algorithm]
+            self.model.process_points_with_vectorized_algorithm(chosen_algorithm)
+        else:
+            chosen_algorithm = self.supported_algorithms[algorithm]
+            self.model.process_points_with_naive_algorithm(chosen_algorithm)
         self.clear_cache()
 
     def prepare_proper_figure(self) -> None:
         match len(self.model.labels):
             case 2:
+                self.model.process_points_with_non_dominated_sorting()
                 figure = self.plot_2Dfigure()
                 st.session_state[self.cached_figure] = figure
             case 3:
+                self.model.process_points_with_non_dominated_sorting()
                 figure = self.plot_3Dfigure()
                 st.session_state[self.cached_figure] = figure
             case 4:
@@ -92,12 +155,16 @@ class NaiveActionMenuPresenter:
                 return
 
     def prepare_benchmark_table(
-        self, dimensionality: int, dataset: list[Point], repeats: int
+        self,
+        dimensionality: int,
+        dataset: list[Point],
+        repeats: int,
+        profile_memory: bool = False,
     ) -> None:
         table_data = []
         for algorithm_name in self.supported_algorithms.keys():
             benchmark = BenchmarkAnalyzer(algorithm_name, dimensionality, dataset)
-            benchmark_result = benchmark.run_algorithm(repeats)
+            benchmark_result = benchmark.run_algorithm(repeats, profile_memory)
             data = {
                 "Algorytm": algorithm_name,
                 "Średni czas porównania (ms)": mean(benchmark_result["times"]) * 1000,
@@ -108,15 +175,35 @@ class NaiveActionMenuPresenter:
                     benchmark_result["comparison_coordinates_counter"]
                 ),
             }
+            if profile_memory:
+                data["Szczytowe zużycie pamięci (KiB)"] = (
+                    mean(benchmark_result["peak_memory"]) / 1024
+                )
+                data["Pamięć zatrzymana po uruchomieniu (KiB)"] = (
+                    mean(benchmark_result["retained_memory"]) / 1024
+                )
+                data["Liczba zatrzymanych alokacji"] = mean(
+                    benchmark_result["retained_allocations"]
+                )
             table_data.append(data)
 
         st.session_state[self.cached_table] = pd.DataFrame(table_data)
 
+    def dominated_layers(self) -> tuple[ndarray, ndarray]:
+        """Rows outside of the solution with their (1-based) Pareto layer numbers.
+
+        An approximate solution leaves out some rows of the first layer as well.
+        """
+        is_dominated = ~self.model.non_dominated_mask
+        return self.model.data[is_dominated], self.model.layers[is_dominated] + 1
+
     def plot_2Dfigure(self) -> Figure:
-        x_dom = [p.x[0] for p in self.model.dominated_points]
-        y_dom = [p.x[1] for p in self.model.dominated_points]
-        x_non_dom = [p.x[0] for p in self.model.non_dominated_points]
-        y_non_dom = [p.x[1] for p in self.model.non_dominated_points]
+        dominated, layers = self.dominated_layers()
+        x_dom = dominated[:, 0]
+        y_dom = dominated[:, 1]
+        non_dominated = self.model.non_dominated_data
+        x_non_dom = non_dominated[:, 0]
+        y_non_dom = non_dominated[:, 1]
 
         fig = go.Figure()
         fig.add_trace(
@@ -126,7 +213,14 @@ class NaiveActionMenuPresenter:
                 mode="markers",
                 name="dominated",
                 marker_symbol="circle",
-                marker=dict(size=10),
+                marker=dict(
+                    size=10,
+                    color=layers,
+                    colorscale="Viridis",
+                    colorbar=dict(title="Warstwa"),
+                    colorbar_x=-0.07,
+                ),
+                hovertext=[f"warstwa {layer}" for layer in layers],
             )
         )
         fig.add_trace(
@@ -149,12 +243,14 @@ class NaiveActionMenuPresenter:
         return fig
 
     def plot_3Dfigure(self) -> Figure:
-        x_dom = [p.x[0] for p in self.model.dominated_points]
-        y_dom = [p.x[1] for p in self.model.dominated_points]
-        z_dom = [p.x[2] for p in self.model.dominated_points]
-        x_non_dom = [p.x[0] for p in self.model.non_dominated_points]
-        y_non_dom = [p.x[1] for p in self.model.non_dominated_points]
-        z_non_dom = [p.x[2] for p in self.model.non_dominated_points]
+        dominated, layers = self.dominated_layers()
+        x_dom = dominated[:, 0]
+        y_dom = dominated[:, 1]
+        z_dom = dominated[:, 2]
+        non_dominated = self.model.non_dominated_data
+        x_non_dom = non_dominated[:, 0]
+        y_non_dom = non_dominated[:, 1]
+        z_non_dom = non_dominated[:, 2]
 
         fig = go.Figure()
         fig.add_trace(
@@ -164,7 +260,16 @@ class NaiveActionMenuPresenter:
                 z=z_dom,
                 mode="markers",
                 name="dominated",
-                marker=dict(symbol="circle", size=5, opacity=0.6),
+                marker=dict(
+                    symbol="circle",
+                    size=5,
+                    opacity=0.6,
+                    color=layers,
+                    colorscale="Viridis",
+                    colorbar=dict(title="Warstwa"),
+                    colorbar_x=-0.07,
+                ),
+                hovertext=[f"warstwa {layer}" for layer in layers],
             )
         )
         fig.add_trace(
@@ -190,14 +295,10 @@ class NaiveActionMenuPresenter:
         return fig
 
     def plot_4Dfigure(self) -> Figure:
-        x_dom = [p.x[0] for p in self.model.dominated_points]
-        y_dom = [p.x[1] for p in self.model.dominated_points]
-        z_dom = [p.x[2] for p in self.model.dominated_points]
-        c_dom = [p.x[3] for p in self.model.dominated_points]
-        x_non_dom = [p.x[0] for p in self.model.non_dominated_points]
-        y_non_dom = [p.x[1] for p in self.model.non_dominated_points]
-        z_non_dom = [p.x[2] for p in self.model.non_dominated_points]
-        c_non_dom = [p.x[3] for p in self.model.non_dominated_points]
+        dominated = self.model.dominated_data
+        non_dominated = self.model.non_dominated_data
+        x_dom, y_dom, z_dom, c_dom = dominated.T
+        x_non_dom, y_non_dom, z_non_dom, c_non_dom = non_dominated.T
 
         fig = go.Figure()
         fig.add_trace(
@@ -271,6 +372,9 @@ class NaiveActionMenuPresenter:
     def is_figure_cached(self) -> bool:
         return self.cached_figure in st.session_state
 
+    def is_timeline_cached(self) -> bool:
+        return self.cached_timeline in st.session_state
+
     def clear_cache(self) -> None:
         if self.cached_table in st.session_state:
             del st.session_state[self.cached_table]
@@ -278,6 +382,8 @@ class NaiveActionMenuPresenter:
             del st.session_state[self.cached_json]
         if self.cached_figure in st.session_state:
             del st.session_state[self.cached_figure]
+        if self.cached_timeline in st.session_state:
+            del st.session_state[self.cached_timeline]
 
 
 class NaiveActionMenuView:
@@ -291,7 +397,17 @@ class NaiveActionMenuView:
 
         with left:
             self.selected_algorithm = st.selectbox(
-                "Algorytm OWD", options=list(presenter.supported_algorithms.keys())
+                "Algorytm OWD", options=presenter.get_algorithm_names()
+            )
+            if presenter.is_approximate(self.selected_algorithm):
+                self.display_epsilon_parameters()
+            self.use_incremental_archive = st.checkbox(
+                "Archiwum przyrostowe",
+                help="Front jest aktualizowany tylko dla zmienionych wierszy danych.",
+            )
+            self.measure_stages = st.checkbox(
+                "Pomiar czasu etapów",
+                help="Czas każdego etapu rozwiązania, także w logach aplikacji.",
             )
             st.button("Rozwiąż", on_click=presenter.run_algorithm)
         with right:
@@ -302,6 +418,10 @@ class NaiveActionMenuView:
                 max_value=200,
                 step=10,
             )
+            self.profile_memory = st.checkbox(
+                "Profilowanie pamięci",
+                help="Każde powtórzenie jest dodatkowo uruchamiane pod tracemalloc.",
+            )
             st.button("Benchmark", on_click=presenter.run_benchmark)
 
         if presenter.is_figure_cached() and presenter.is_table_cached():
@@ -321,6 +441,35 @@ class NaiveActionMenuView:
         else:
             self.display_no_visualization_message_banner()
 
+        if presenter.is_timeline_cached():
+            self.display_timeline(st.session_state[presenter.cached_timeline])
+
+    def display_timeline(self, breakdown: list[dict[str, float | str]]) -> None:
+        with st.expander("Czas etapów"):
+            st.dataframe(
+                pd.DataFrame(breakdown).rename(
+                    columns={"stage": "Etap", "ms": "Czas (ms)", "share": "Udział"}
+                ),
+                hide_index=True,
+            )
+
+    def display_epsilon_parameters(self) -> None:
+        left, right = st.columns([1, 1])
+        with left:
+            self.epsilon = st.number_input(
+                "Epsilon",
+                value=0.01,
+                min_value=0.0001,
+                max_value=1000.0,
+                step=0.01,
+                format="%.4f",
+            )
+        with right:
+            self.is_epsilon_relative = (
+                st.radio("Rodzaj epsilona", options=["względny", "bezwzględny"])
+                == "względny"
+            )
+
     def display_json(self, json: dict[str, Any]) -> None:
         """For solving 5+ dimensional problems (can't plot that)."""
         left, right = st.columns([1, 1])
@@ -4,6 +4,7 @@ import numpy as np
 import streamlit as st
 from ..algorithms.ideal_point import ideal_point_method
 from ..algorithms.rsm import reference_set_method
+from ..algorithms.uta_star import uta_star
 from ..algorithms.interface import RankingMethod, OWDAlgorithm, RANKING_ALGORITHMS
 
 
@@ -16,20 +17,57 @@ class Model(Protocol):
     def class_data(self) -> np.ndarray:
         ...
 
+    @property
+    def signs(self) -> np.ndarray:
+        ...
+
     def process_points_with_naive_algorithm(self, algorithm: OWDAlgorithm) -> None:
         ...
 
     def process_points_with_ranking_method(self, algorithm: RankingMethod) -> None:
         ...
 
-def build_rsm_with_reference_sets(model: Model) -> RankingMethod:
+    def process_points_with_ranking_methods(
+        self, algorithms: dict[str, RankingMethod]
+    ) -> None:
+        ...
+
+def rsm_reference_sets(model: Model) -> dict[str, np.ndarray]:
+    """Keyword arguments of reference_set_method, A1 class rows are ideal and A0 the status quo.
+
+    The rows are signed like the alternatives the methods get, every criterion minimised.
+    """
     ideal_bool_index = np.array([cn == "A1" for cn in model.class_names])
     status_quo_bool_index = np.array([cn == "A0" for cn in model.class_names])
 
-    ideal = model.class_data[ideal_bool_index]
-    status_quo = model.class_data[status_quo_bool_index]
+    class_data = np.asarray(model.class_data, dtype=float) * model.signs
+    ideal = class_data[ideal_bool_index]
+    status_quo = class_data[status_quo_bool_index]
+
+    return {"ideal_points_set": ideal, "status_quo_points_set": status_quo}
+
+
+def build_rsm_with_reference_sets(model: Model) -> RankingMethod:
+    return partial(reference_set_method, **rsm_reference_sets(model))
+
+
+def uta_star_options(
+    model: Model, breakpoint_counts: int, fit_to_classes: bool
+) -> dict[str, int | np.ndarray]:
+    """Keyword arguments of uta_star, with A1 class rows preferred over A0 ones if requested."""
+    if not fit_to_classes:
+        return {"breakpoint_counts": breakpoint_counts}
+    reference_sets = rsm_reference_sets(model)
+    return {
+        "breakpoint_counts": breakpoint_counts,
+        "preferred_points_set": reference_sets["ideal_points_set"],
+        "non_preferred_points_set": reference_sets["status_quo_points_set"],
+    }
+
 
-    return partial(reference_set_method, ideal_points_set=ideal, status_quo_points_set=status_quo)
+def build_uta_star(model: Model, breakpoint_counts: int, fit_to_classes: bool) -> RankingMethod:
+    """UTA Star, with marginal utilities fitted to prefer A1 class rows over A0 ones if requested."""
+    return partial(uta_star, **uta_star_options(model, breakpoint_counts, fit_to_classes))
 
 
 class RankingActionMenuPresenter:
@@ -39,13 +77,28 @@ class RankingActionMenuPresenter:
         self.supported_algorithms = RANKING_ALGORITHMS
         self.view.init_ui(self)
 
-    def run_algorithm(self) -> None:
-        algorithm = self.supported_algorithms[self.view.selected_algorithm]
+    def build_algorithm(self, name: str) -> RankingMethod:
+        algorithm = self.supported_algorithms[name]
         if algorithm == reference_set_method:
             algorithm = build_rsm_with_reference_sets(self.model)
+        elif algorithm == uta_star:
+            algorithm = build_uta_star(
+                self.model, self.view.breakpoint_counts, self.view.fit_to_classes
+            )
+        return algorithm
+
+    def run_algorithm(self) -> None:
+        algorithm = self.build_algorithm(self.view.selected_algorithm)
         self.model.process_points_with_naive_algorithm(ideal_point_method)
         self.model.process_points_with_ranking_method(algorithm)
 
+    def run_all_algorithms(self) -> None:
+        algorithms = {
+            name: self.build_algorithm(name) for name in self.supported_algorithms
+        }
+        self.model.process_points_with_naive_algorithm(ideal_point_method)
+        self.model.process_points_with_ranking_methods(algorithms)
+
 class RankingActionMenuView:
     def __init__(self, title: str) -> None:
         self.title = title
@@ -59,3 +112,17 @@ class RankingActionMenuView:
             )
         with right:
             st.button("Stwórz ranking", on_click=presenter.run_algorithm)
+            st.button("Uruchom wszystkie metody", on_click=presenter.run_all_algorithms)
+        # UTA Star settings, the defaults apply unless it is selected
+        self.breakpoint_counts = 2
+        self.fit_to_classes = False
+        if presenter.supported_algorithms[self.selected_algorithm] == uta_star:
+            self.breakpoint_counts = st.number_input(
+                "Punkty charakterystyczne kryterium", min_value=2, max_value=50, value=2
+            )
+            class_names = presenter.model.class_names
+            self.fit_to_classes = st.checkbox(
+                "Dopasuj funkcje użyteczności do klas (A1 lepsza od A0)",
+                disabled="A1" not in class_names or "A0" not in class_names,
+                help="Wymaga co najmniej jednej alternatywy w klasach A1 i A0.",
+            )
@@ -0,0 +1,169 @@
+from typing import Protocol
+import os
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from ..algorithms.ideal_point import ideal_point_method
+from ..algorithms.interface import RANKING_ALGORITHMS, OWDAlgorithm
+from ..algorithms.rsm import reference_set_method
+from ..algorithms.uta_star import uta_star
+from .model import PropertyNotReadyError
+from .ranking_action_menu import (
+    RankingActionMenuView,
+    rsm_reference_sets,
+    uta_star_options,
+)
+
+
+class Model(Protocol):
+    @property
+    def labels(self) -> list[str]:
+        ...
+
+    @property
+    def criteria_weights(self) -> list[float]:
+        ...
+
+    @property
+    def class_names(self) -> list[str]:
+        ...
+
+    @property
+    def class_data(self) -> np.ndarray:
+        ...
+
+    @property
+    def alternative_names(self) -> list[str]:
+        ...
+
+    @property
+    def acceptability(self) -> tuple[np.ndarray, np.ndarray]:
+        ...
+
+    def process_points_with_naive_algorithm(self, algorithm: OWDAlgorithm) -> None:
+        ...
+
+    def process_points_with_sensitivity_analysis(
+        self,
+        method: str,
+        samples: int,
+        seed: int,
+        box: tuple[np.ndarray, np.ndarray] | None,
+        options: dict | None,
+        workers: int | None,
+    ) -> None:
+        ...
+
+
+def build_acceptability_figure(model: Model) -> go.Figure | None:
+    try:
+        front, acceptability = model.acceptability
+    except PropertyNotReadyError:
+        return None
+    names = [model.alternative_names[i] for i in front]
+    # alternatives ordered by their expected rank, the most stable winners on top
+    order = np.argsort(acceptability @ np.arange(len(front)))
+    figure = go.Figure(
+        go.Heatmap(
+            z=acceptability[order],
+            x=np.arange(1, len(front) + 1),
+            y=[names[i] for i in order],
+            colorscale="Blues",
+            zmin=0,
+            zmax=1,
+            colorbar={"title": "Udział"},
+        )
+    )
+    figure.update_layout(
+        xaxis_title="Pozycja w rankingu",
+        yaxis_title="Alternatywa",
+        yaxis_autorange="reversed",
+    )
+    return figure
+
+
+class SensitivityAnalysisPresenter:
+    def __init__(
+        self,
+        model: Model,
+        view: "SensitivityAnalysisView",
+        ranking_view: RankingActionMenuView,
+    ) -> None:
+        self.model = model
+        self.view = view
+        # UTA Star is analysed with the settings chosen in the ranking menu
+        self.ranking_view = ranking_view
+        self.supported_algorithms = RANKING_ALGORITHMS
+        self.view.init_ui(self)
+
+    def run_analysis(self) -> None:
+        method = self.view.selected_algorithm
+        options = None
+        if self.supported_algorithms[method] is reference_set_method:
+            options = rsm_reference_sets(self.model)
+        elif self.supported_algorithms[method] is uta_star:
+            options = uta_star_options(
+                self.model,
+                self.ranking_view.breakpoint_counts,
+                self.ranking_view.fit_to_classes,
+            )
+        box = None
+        if self.view.weight_ranges is not None:
+            box = tuple(np.array(bounds) for bounds in zip(*self.view.weight_ranges))
+        self.model.process_points_with_naive_algorithm(ideal_point_method)
+        self.model.process_points_with_sensitivity_analysis(
+            method, self.view.samples, self.view.seed, box, options, self.view.workers
+        )
+
+
+class SensitivityAnalysisView:
+    def __init__(self, title: str) -> None:
+        self.title = title
+
+    def init_ui(self, presenter: SensitivityAnalysisPresenter) -> None:
+        st.subheader(self.title, divider=True)
+        left, middle, right, workers = st.columns(4)
+        with left:
+            self.selected_algorithm = st.selectbox(
+                "Metoda rankingowa",
+                options=list(presenter.supported_algorithms.keys()),
+                key="sensitivity-algorithm",
+            )
+        with middle:
+            self.samples = st.number_input(
+                "Liczba próbek", min_value=1, max_value=100_000, value=1000, step=100
+            )
+        with right:
+            self.seed = st.number_input("Ziarno", min_value=0, value=0, step=1)
+        with workers:
+            self.workers = st.number_input(
+                "Liczba procesów",
+                min_value=1,
+                value=os.cpu_count() or 1,
+                step=1,
+                help="Wynik zależy tylko od ziarna, nie od liczby procesów.",
+            )
+
+        distribution = st.radio(
+            "Rozkład wag", options=["Dirichlet", "Przedział"], horizontal=True
+        )
+        self.weight_ranges = None
+        if distribution == "Przedział":
+            # ranges default to a neighbourhood of the current weights
+            self.weight_ranges = [
+                st.slider(
+                    f"Waga kryterium {label}",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=(max(weight - 0.1, 0.0), min(weight + 0.1, 1.0)),
+                    step=0.01,
+                )
+                for label, weight in zip(
+                    presenter.model.labels, presenter.model.criteria_weights
+                )
+            ]
+        st.button("Analizuj", on_click=presenter.run_analysis)
+
+        figure = build_acceptability_figure(presenter.model)
+        if figure is not None:
+            st.plotly_chart(figure, use_container_width=True)
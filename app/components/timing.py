@@ -0,0 +1,99 @@
+import json
+import logging
+import time
+from contextvars import ContextVar, Token
+
+logger = logging.getLogger(__name__)
+
+
+class Timeline:
+    """Durations of the stages wrapped in span() within `with Timeline() as timeline:`.
+
+    A disabled timeline doesn't become current, so every span() inside it is a no-op.
+    Nested spans are recorded under "outer / inner" names.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled: bool = enabled
+        self.stages: list[tuple[str, float]] = []
+        self._open: list[str] = []
+        self._token: Token | None = None
+        self._start: float = 0.0
+        self.total: float = 0.0
+
+    def __enter__(self) -> "Timeline":
+        if self.enabled:
+            self._token = _current_timeline.set(self)
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.enabled:
+            self.total = time.perf_counter() - self._start
+            _current_timeline.reset(self._token)
+
+    def breakdown(self) -> list[dict[str, float | str]]:
+        """Stages in the order they were entered, in milliseconds and as a share of the total."""
+        return [
+            {
+                "stage": name,
+                "ms": duration * 1000,
+                "share": duration / self.total if self.total else 0.0,
+            }
+            for name, duration in self.stages
+        ]
+
+    def log(self, **context) -> None:
+        """Emits the breakdown as a single JSON log line."""
+        record = {
+            **context,
+            "total_ms": self.total * 1000,
+            "stages": {name: duration * 1000 for name, duration in self.stages},
+        }
+        logger.info("timeline %s", json.dumps(record))
+
+
+_current_timeline: ContextVar[Timeline | None] = ContextVar("timeline", default=None)
+
+
+class _Span:
+    __slots__ = ("timeline", "name", "start", "position")
+
+    def __init__(self, timeline: Timeline, name: str) -> None:
+        self.timeline = timeline
+        self.name = name
+
+    def __enter__(self) -> None:
+        timeline = self.timeline
+        timeline._open.append(self.name)
+        # reserve the position, so an outer stage is listed before its inner stages
+        self.position = len(timeline.stages)
+        timeline.stages.append((" / ".join(timeline._open), 0.0))
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        duration = time.perf_counter() - self.start
+        timeline = self.timeline
+        timeline.stages[self.position] = (timeline.stages[self.position][0], duration)
+        timeline._open.pop()
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str) -> _Span | _NoSpan:
+    """Times the wrapped stage if a Timeline is active, does nothing otherwise."""
+    timeline = _current_timeline.get()
+    if timeline is None:
+        return _NO_SPAN
+    return _Span(timeline, name)
@@ -13,7 +13,9 @@ from app.components.dataset_generator import (
 from app.components.dataset_loader import (
     DatasetLoaderView,
     DatasetLoaderPresenter,
+    DatasetPathLoaderView,
     CSVDatasetLoader,
+    BinaryDatasetLoader,
 )
 from app.components.naive_action_menu import (
     NaiveActionMenuView,
@@ -36,10 +38,12 @@ with left:
 with right:
     datatable_placeholder = st.empty()
     dataset_loader_placeholder = st.empty()
+    binary_dataset_loader_placeholder = st.empty()
 algorithm_runner_placeholder = st.empty()
 
 # views
 dataset_loader_view = DatasetLoaderView("Moduł ładujący zbiór danych")
+binary_dataset_loader_view = DatasetPathLoaderView("Moduł ładujący zbiór binarny")
 criteria_view = CriteriaEditorView("Edytor kryteriów")
 dataset_generator_view = DatasetGeneratorView("Generator zbioru danych")
 datatable_view = DataTableView("Podgląd zbioru danych")
@@ -50,6 +54,10 @@ with dataset_loader_placeholder.container():
     DatasetLoaderPresenter(
         model=model, view=dataset_loader_view, loader=CSVDatasetLoader()
     )
+with binary_dataset_loader_placeholder.container():
+    DatasetLoaderPresenter(
+        model=model, view=binary_dataset_loader_view, loader=BinaryDatasetLoader()
+    )
 with criteria_editor_placeholder.container():
     CriteriaPresenter(model=model, view=criteria_view)
 with dataset_generator_placeholder.container():
@@ -6,6 +6,7 @@ from app.components.dataset_display import (
     build_alternatives_table_view_df,
     build_class_table_view_df,
     build_ranking_table_view_df,
+    build_rankings_comparison_table_view_df,
 )
 from app.components.dataset_loader import (
     DatasetLoaderView,
@@ -16,6 +17,10 @@ from app.components.ranking_action_menu import (
     RankingActionMenuPresenter,
     RankingActionMenuView,
 )
+from app.components.sensitivity_analysis import (
+    SensitivityAnalysisPresenter,
+    SensitivityAnalysisView,
+)
 
 st.set_page_config(
     page_title="Optymalizacja wielokryterialna - Metody rankingowe", layout="wide"
@@ -34,13 +39,17 @@ with right:
     algorithm_runner_placeholder = st.empty()
     classes_display_placeholder = st.empty()
 ranking_display_placeholder = st.empty()
+rankings_comparison_placeholder = st.empty()
+sensitivity_analysis_placeholder = st.empty()
 
 # views
 dataset_loader_view = DatasetLoaderView("Moduł ładujący zbiór danych")
 alternatives_view = DataTableView("Alternatywy z kryteriami")
 classes_view = DataTableView("Klasy")
 ranking_view = DataTableView("Stworzony ranking")
+rankings_comparison_view = DataTableView("Porównanie metod rankingowych")
 algorithm_runner_view = RankingActionMenuView("Akcje")
+sensitivity_analysis_view = SensitivityAnalysisView("Analiza wrażliwości wag")
 
 # presenters
 with dataset_loader_placeholder.container():
@@ -61,3 +70,15 @@ with ranking_display_placeholder.container():
     DataTablePresenter(
         model=model, view=ranking_view, build_df=build_ranking_table_view_df
     )
+with rankings_comparison_placeholder.container():
+    DataTablePresenter(
+        model=model,
+        view=rankings_comparison_view,
+        build_df=build_rankings_comparison_table_view_df,
+    )
+with sensitivity_analysis_placeholder.container():
+    SensitivityAnalysisPresenter(
+        model=model,
+        view=sensitivity_analysis_view,
+        ranking_view=algorithm_runner_view,
+    )
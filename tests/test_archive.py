@@ -0,0 +1,30 @@
+import numpy as np
+from app.algorithms.archive import ParetoArchive
+from app.algorithms.filtered import naive_with_filtering
+from app.algorithms.point import create_points_from_datapoints
+
+
+def front_rows(archive: ParetoArchive, rows: dict[int, tuple]) -> set[tuple]:
+    return {rows[point_id] for point_id in archive.front().tolist()}
+
+
+def expected_front_rows(rows: dict[int, tuple]) -> set[tuple]:
+    points = create_points_from_datapoints(list(rows.values()))
+    return {tuple(p.x) for p in naive_with_filtering(points)}
+
+
+def test_pareto_archive_insert_and_remove():
+    rng = np.random.default_rng(0)
+    # integer coordinates produce duplicated rows
+    data = rng.integers(0, 6, size=(200, 3)).astype(float)
+    archive = ParetoArchive(dim=3, capacity=4)
+    rows = {archive.insert(row): tuple(row) for row in data}
+
+    assert len(archive.front()) == len(expected_front_rows(rows))
+    assert front_rows(archive, rows) == expected_front_rows(rows)
+
+    for point_id in rng.permutation(list(rows))[:150]:
+        archive.remove(point_id)
+        del rows[point_id]
+        assert len(archive.front()) == len(expected_front_rows(rows))
+        assert front_rows(archive, rows) == expected_front_rows(rows)
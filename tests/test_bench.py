@@ -0,0 +1,75 @@
+import json
+import pandas as pd
+from app.algorithms.interface import BenchmarkConfiguration, run_grid
+from app.bench import BENCHMARK_COLUMNS, main
+
+
+def test_bench_writes_seeded_results_and_compares(tmp_path):
+    arguments = [
+        "--distributions",
+        "uniform",
+        "--dimensionalities",
+        "2",
+        "--cardinalities",
+        "30",
+        "--algorithms",
+        "filtered naive",
+        "kung divide and conquer",
+        "--repeats",
+        "2",
+        "--seed",
+        "7",
+    ]
+    assert main(arguments + ["--output", str(tmp_path / "first.csv")]) == 0
+    main(arguments + ["--output", str(tmp_path / "second.csv")])
+
+    first = pd.read_csv(tmp_path / "first.csv")
+    second = pd.read_csv(tmp_path / "second.csv")
+    assert list(first.columns) == BENCHMARK_COLUMNS
+    assert len(first) == 4
+    counters = ["comparison_point_counter", "comparison_coordinates_counter"]
+    assert first[counters].equals(second[counters])
+    assert len(json.loads((tmp_path / "first.json").read_text())[0]["times"]) == 2
+
+    # an impossibly fast baseline is a significant slowdown
+    first["times"] = 1e-12
+    first.to_csv(tmp_path / "baseline.csv", index=False)
+    assert (
+        main(
+            arguments
+            + [
+                "--output",
+                str(tmp_path / "third.csv"),
+                "--compare",
+                str(tmp_path / "baseline.csv"),
+            ]
+        )
+        == 1
+    )
+
+
+def test_run_grid_kills_configurations_over_the_timeout():
+    quick = BenchmarkConfiguration("uniform", 2, 20, False, "filtered naive")
+    slow = BenchmarkConfiguration(
+        "uniform", 5, 20_000, False, "naive without filtration"
+    )
+
+    results = list(run_grid([slow, quick], workers=2, timeout=1.0))
+
+    assert [result["status"] for result in results] == ["ok", "timeout"]
+    assert results[0]["cardinality"] == 20
+    assert len(results[0]["times"]) == 1
+
+
+def test_memory_profile_is_reported_per_repeat():
+    configuration = BenchmarkConfiguration(
+        "uniform", 3, 200, False, "filtered naive", repeats=2, profile_memory=True
+    )
+
+    result = configuration.run()
+
+    assert len(result["peak_memory"]) == 2
+    assert min(result["peak_memory"]) > 0
+    # the returned front is still alive when the snapshot is taken
+    assert min(result["retained_memory"]) > 0
+    assert len(result["retained_allocations"]) == 2
@@ -0,0 +1,43 @@
+import numpy as np
+from app.algorithms.bnl import block_nested_loops
+from app.algorithms.filtered import naive_with_filtering
+from app.algorithms.point import create_points_from_datapoints
+
+
+def test_block_nested_loops():
+    test_datapoints = np.array(
+        [
+            (5, 5),
+            (3, 6),
+            (4, 4),
+            (5, 3),
+            (3, 3),
+            (1, 8),
+            (3, 4),
+            (4, 5),
+            (3, 10),
+            (6, 6),
+            (4, 1),
+            (3, 5),
+        ]
+    )
+
+    rows, indices = block_nested_loops(np.array_split(test_datapoints, 4))
+
+    assert indices.tolist() == [4, 5, 10]
+    assert rows.tolist() == test_datapoints[[4, 5, 10]].tolist()
+
+
+def test_block_nested_loops_spills_like_naive_with_filtering():
+    rng = np.random.default_rng(0)
+    # anti-correlated rows keep the front large, so the window overflows
+    data = np.round(rng.uniform(size=(200, 3)), 2)
+    data[:, 2] = 2 - data[:, 0] - data[:, 1]
+    expected = {tuple(p.x) for p in naive_with_filtering(create_points_from_datapoints(data))}
+
+    # room for only 8 candidates at once
+    rows, indices = block_nested_loops(np.array_split(data, 7), memory_limit=8 * 41)
+
+    assert rows.tolist() == data[indices].tolist()
+    assert len(indices) == len(set(indices.tolist())) == len(expected)
+    assert {tuple(row) for row in rows} == expected
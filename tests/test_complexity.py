@@ -0,0 +1,48 @@
+import numpy as np
+from app.complexity import (
+    cardinality_ladder,
+    fit_n_log_n,
+    fit_power_law,
+    fit_scaling,
+    measure_scaling,
+)
+
+
+def test_fits_recover_the_scaling_model():
+    n = np.array(cardinality_ladder(100, 12_800), dtype=float)
+    noise = np.random.default_rng(0).normal(1, 0.01, size=len(n))
+
+    quadratic = fit_power_law(n, 3 * n**2 * noise)
+    assert quadratic["exponent_low"] < 2 < quadratic["exponent_high"]
+    assert abs(quadratic["exponent"] - 2) < 0.05
+
+    n_log_n = fit_n_log_n(n, 0.5 * n * np.log(n))
+    assert np.isclose(n_log_n["n_log_n_coefficient"], 0.5)
+    assert n_log_n["n_log_n_error"] < 1e-9
+
+
+def test_scaling_report_covers_every_algorithm():
+    measurements = measure_scaling(
+        ["filtered naive", "TOPSIS"], ["uniform"], [2], cardinality_ladder(50, 200)
+    )
+    fits = fit_scaling(measurements)
+
+    assert len(measurements) == 2 * 3
+    # ranking methods don't compare points, only their time is fitted
+    assert fits.groupby("algorithm")["metric"].count().to_dict() == {
+        "TOPSIS": 1,
+        "filtered naive": 3,
+    }
+
+
+def test_slow_algorithms_leave_the_ladder():
+    measurements = measure_scaling(
+        ["filtered naive", "TOPSIS"],
+        ["uniform"],
+        [2],
+        cardinality_ladder(50, 400),
+        time_budget=0.0,
+    )
+
+    # every algorithm exceeds the budget at the first cardinality
+    assert measurements["cardinality"].tolist() == [50, 50]
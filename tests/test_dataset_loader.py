@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from app.components.dataset_loader import (
+    BinaryDatasetLoader,
+    CSVDatasetLoader,
+    convert_to_binary_dataset,
+    resolve_dataset_path,
+    save_binary_dataset,
+)
+
+
+def test_binary_dataset_round_trip(tmp_path):
+    convert_to_binary_dataset("datasets/cereal_3.csv", tmp_path / "cereal_3")
+    csv_dataset, binary_dataset = SimpleNamespace(), SimpleNamespace()
+    csv_loader, binary_loader = CSVDatasetLoader(), BinaryDatasetLoader()
+    csv_loader.read("datasets/cereal_3.csv")
+    csv_loader.populate_model(csv_dataset)
+
+    binary_loader.read(tmp_path / "cereal_3.npy")
+    binary_loader.populate_model(binary_dataset)
+
+    assert isinstance(binary_dataset.data, np.memmap)
+    assert np.array_equal(binary_dataset.data, csv_dataset.data)
+    assert binary_dataset.labels == csv_dataset.labels
+    assert binary_dataset.directions == csv_dataset.directions
+
+
+def test_sidecar_lists_need_one_entry_per_criterion(tmp_path):
+    save_binary_dataset(tmp_path / "data", np.ones((4, 3)), ["a", "b"], ["Min"] * 3)
+    loader = BinaryDatasetLoader()
+    loader.read(tmp_path / "data.npy")
+
+    with pytest.raises(ValueError, match="2 labels for 3 criteria"):
+        loader.populate_model(SimpleNamespace())
+
+
+def test_dataset_paths_cant_leave_the_data_directory(tmp_path):
+    (tmp_path / "data").mkdir()
+
+    assert resolve_dataset_path("a.npy", tmp_path / "data") == (
+        tmp_path / "data" / "a.npy"
+    ).resolve()
+    for path in ("../a.npy", tmp_path / "a.npy", "/etc/passwd"):
+        with pytest.raises(ValueError, match="outside of the data directory"):
+            resolve_dataset_path(path, tmp_path / "data")
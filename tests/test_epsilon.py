@@ -0,0 +1,46 @@
+import numpy as np
+from app.algorithms.epsilon import epsilon_front, epsilon_steps
+from app.algorithms.filtered import block_naive_with_filtering
+from app.algorithms.point_set import PointSet
+
+
+def test_epsilon_front_with_tiny_epsilon_is_exact():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    indices = epsilon_front(PointSet(np.array(test_datapoints)), 0.1, relative=False)
+
+    assert indices.tolist() == [4, 5, 10]
+
+
+def test_epsilon_front_is_an_epsilon_approximation():
+    rng = np.random.default_rng(0)
+    data = rng.uniform(size=(2000, 5))
+    data[:, -1] = 3 - data[:, :-1].sum(axis=1)
+    points = PointSet(data)
+
+    for epsilon, relative in ((0.2, True), ([0.1, 0.2, 0.3, 0.1, 0.5], False)):
+        indices = epsilon_front(points, epsilon, relative)
+        steps = epsilon_steps(data, epsilon, relative)
+
+        front = data[indices]
+        assert len(indices) < len(block_naive_with_filtering(points))
+        # every row is epsilon-dominated by some returned row
+        covered = np.all(front[None, :, :] <= data[:, None, :] + steps, axis=2)
+        assert covered.any(axis=1).all()
+        # returned rows don't dominate each other
+        assert set(block_naive_with_filtering(PointSet(front)).tolist()) == set(
+            range(len(front))
+        )
@@ -29,3 +29,14 @@ def test_ideal_point_method():
 
     assert all(p in non_dominated_points for p in expected_non_dominated_points)
     assert all(p in expected_non_dominated_points for p in non_dominated_points)
+
+
+def test_ideal_point_method_keeps_large_fronts():
+    # every point is non-dominated, more than half of them used to be dropped
+    test_datapoints = [(i, 10 - i) for i in range(11)]
+
+    points = create_points_from_datapoints(test_datapoints)
+    non_dominated_points = ideal_point_method(points)
+
+    assert len(non_dominated_points) == len(points)
+    assert all(p in non_dominated_points for p in points)
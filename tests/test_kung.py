@@ -0,0 +1,56 @@
+import numpy as np
+from app.algorithms.interface import NAIVE_ALGORITHMS
+from app.algorithms.kung import kung_method
+from app.algorithms.point import ComparisonStats, Point, create_points_from_datapoints
+
+
+def test_kung_method():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    points = create_points_from_datapoints(test_datapoints)
+    non_dominated_points = kung_method(points)
+    expected_non_dominated_points = [
+        Point(np.array([3, 3])),
+        Point(np.array([4, 1])),
+        Point(np.array([1, 8])),
+    ]
+
+    assert all(p in non_dominated_points for p in expected_non_dominated_points)
+    assert all(p in expected_non_dominated_points for p in non_dominated_points)
+
+
+def test_kung_method_matches_filtered_naive():
+    rng = np.random.default_rng(0)
+    for dim in (2, 3, 4, 5):
+        # ties and an anti-correlated front exercise every filter branch
+        data = rng.integers(0, 6, (300, dim)).astype(float)
+        data[:150, -1] = -data[:150, :-1].sum(axis=1)
+        points = create_points_from_datapoints(data)
+
+        front = {tuple(p.x) for p in kung_method(points)}
+        expected = {tuple(p.x) for p in NAIVE_ALGORITHMS["filtered naive"](points)}
+
+        assert front == expected
+
+
+def test_kung_method_counts_comparisons():
+    data = np.random.default_rng(1).random((200, 3))
+
+    with ComparisonStats() as stats:
+        kung_method(create_points_from_datapoints(data))
+
+    assert stats.point_comparisons > 0
+    assert stats.coordinate_comparisons >= stats.point_comparisons
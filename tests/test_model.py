@@ -0,0 +1,185 @@
+import os
+import numpy as np
+from app.algorithms.interface import NAIVE_ALGORITHMS, RANKING_ALGORITHMS
+from app.components.criteria_editor import CriteriaPresenter
+from app.components.model import Model, _fingerprint
+
+
+def test_directions_are_applied_without_mutating_results():
+    model = Model("test-model")
+    model.data = np.array([[1.0, 5.0], [2.0, 6.0], [0.0, 1.0], [3.0, 3.0]])
+    model.directions = ["Min", "Max"]
+
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    front = model.non_dominated_data.tolist()
+    model.process_points_with_ranking_method(RANKING_ALGORITHMS["TOPSIS"])
+    first_ranking = model.ranking
+    model.process_points_with_ranking_method(RANKING_ALGORITHMS["TOPSIS"])
+
+    assert front == [[1.0, 5.0], [2.0, 6.0], [0.0, 1.0]]
+    assert model.non_dominated_data.tolist() == front
+    assert model.dominated_data.tolist() == [[3.0, 3.0]]
+    assert model.ranking == first_ranking
+    # rankings refer to rows of the data
+    assert sorted(model.ranking[0]) == [0, 1, 2]
+
+
+def test_derived_state_is_reused_until_its_fields_change():
+    model = Model("test-cached-model")
+    model.data = np.random.default_rng(0).random((30, 4))
+    model.labels = ["a", "b", "c", "d"]
+    model.directions = ["Min"] * 4
+    calls = []
+
+    def counted_algorithm(points):
+        calls.append(len(points))
+        return NAIVE_ALGORITHMS["filtered naive"](points)
+
+    model.process_points_with_naive_algorithm(counted_algorithm)
+    model.data = model.data.copy()
+    model.criteria_weights = [0.25] * 4
+    model.process_points_with_naive_algorithm(counted_algorithm)
+    assert calls == [30]
+
+    model.directions = ["Max"] * 4
+    model.process_points_with_naive_algorithm(counted_algorithm)
+    assert calls == [30, 30]
+
+    def other_counted_algorithm(points):
+        calls.append(-len(points))
+        return NAIVE_ALGORITHMS["ideal point method"](points)
+
+    # another algorithm isn't served from the entry of the previous one
+    model.process_points_with_naive_algorithm(other_counted_algorithm)
+    assert calls == [30, 30, -30]
+    assert model.points is model.points
+
+
+def test_all_ranking_methods_match_single_runs():
+    model = Model("test-rankings-model")
+    model.data = np.random.default_rng(1).random((40, 3))
+    model.labels = ["a", "b", "c"]
+    model.directions = ["Min", "Max", "Min"]
+    model.criteria_weights = [0.2, 0.3, 0.5]
+    algorithms = {
+        name: RANKING_ALGORITHMS[name] for name in ("TOPSIS", "UTA Star", "VIKOR")
+    }
+
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    model.process_points_with_ranking_methods(algorithms)
+
+    assert list(model.rankings) == list(algorithms)
+    for name, algorithm in algorithms.items():
+        model.process_points_with_ranking_method(algorithm)
+        assert model.rankings[name][0] == model.ranking[0]
+        assert np.allclose(model.rankings[name][1], model.ranking[1])
+
+
+def test_sensitivity_analysis_doesnt_depend_on_the_workers():
+    acceptabilities = []
+    for workers in (1, 2):
+        model = Model(f"test-sensitivity-model-{workers}")
+        model.data = np.random.default_rng(2).random((30, 3))
+        model.labels = ["a", "b", "c"]
+        model.directions = ["Min", "Max", "Min"]
+        model.criteria_weights = [0.2, 0.3, 0.5]
+        model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+        model.process_points_with_sensitivity_analysis(
+            "UTA Star", samples=200, options={"breakpoint_counts": 3}, workers=workers
+        )
+        acceptabilities.append(model.acceptability)
+
+    (front, sequential), (parallel_front, parallel) = acceptabilities
+    assert np.array_equal(front, parallel_front)
+    assert np.array_equal(sequential, parallel)
+
+
+class _NoView:
+    def init_ui(self, presenter) -> None:
+        pass
+
+
+def test_added_and_removed_criteria_keep_directions_in_sync():
+    model = Model("test-criteria-model")
+    model.data = np.array([[1.0, 5.0], [2.0, 6.0], [0.0, 1.0], [3.0, 3.0]])
+    model.labels = ["x", "y"]
+    model.directions = ["Min", "Max"]
+    presenter = CriteriaPresenter(model, _NoView())
+
+    presenter.add_column()
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    assert model.signs.tolist() == [1.0, -1.0, 1.0]
+    assert model.non_dominated_data.tolist() == [
+        [1.0, 5.0, 0.0],
+        [2.0, 6.0, 0.0],
+        [0.0, 1.0, 0.0],
+    ]
+
+    presenter.remove_column("x")
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    assert model.directions == ["Max", "Min"]
+    assert model.non_dominated_data.tolist() == [[6.0, 0.0]]
+
+    presenter.remove_column("Nowe Kryterium #1")
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    assert model.signs.tolist() == [-1.0]
+    assert model.non_dominated_data.tolist() == [[6.0]]
+
+
+def test_large_object_arrays_get_distinct_fingerprints():
+    names = np.array([f"alt{i}" for i in range(5000)], dtype=object)
+    renamed = names.copy()
+    renamed[2500] = "renamed"
+
+    assert _fingerprint(names) != _fingerprint(renamed)
+
+
+def test_memory_mapped_data_is_fingerprinted_by_its_file(tmp_path):
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(40.0).reshape(10, 4))
+    data = np.load(path, mmap_mode="r")
+
+    assert _fingerprint(data[:5]) == _fingerprint(np.load(path, mmap_mode="r")[:5])
+    assert _fingerprint(data[:5]) != _fingerprint(data[5:])
+    assert _fingerprint(data[::2]) != _fingerprint(data[:5])
+
+    fingerprint = _fingerprint(data)
+    os.utime(path, ns=(0, 0))
+    assert _fingerprint(data) != fingerprint
+
+
+def _assert_archive_matches_filtered_naive(model: Model) -> None:
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    expected = model.non_dominated_mask.copy()
+    model.process_points_with_archive()
+    assert np.array_equal(model.non_dominated_mask, expected)
+
+
+def test_pareto_archive_follows_data_changes():
+    rng = np.random.default_rng(4)
+    model = Model("test-archive-model")
+    model.data = rng.random((60, 3))
+    model.labels = ["a", "b", "c"]
+    model.directions = ["Min", "Max", "Min"]
+    _assert_archive_matches_filtered_naive(model)
+
+    edited = model.data.copy()
+    edited[:3] = rng.random((3, 3)) * 0.1
+    model.data = edited
+    _assert_archive_matches_filtered_naive(model)
+
+    model.data = np.vstack([model.data, rng.random((5, 3))])
+    _assert_archive_matches_filtered_naive(model)
+
+    model.data = np.delete(model.data, [0, 10, 20], axis=0)
+    _assert_archive_matches_filtered_naive(model)
+
+    # edited in place and assigned back, there is no previous copy to compare with
+    data = model.data
+    data[5] = [0.0, 1.0, 0.0]
+    model.data = data
+    _assert_archive_matches_filtered_naive(model)
+    assert model.non_dominated_mask.tolist() == [i == 5 for i in range(len(data))]
+
+    model.data = model.data[rng.permutation(len(model.data))]
+    _assert_archive_matches_filtered_naive(model)
@@ -0,0 +1,54 @@
+import numpy as np
+from app.algorithms.non_dominated_sorting import (
+    _deb_sort,
+    _sort_3d,
+    fast_non_dominated_sort,
+)
+from app.algorithms.point_set import PointSet
+
+
+def test_fast_non_dominated_sort():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    layers = fast_non_dominated_sort(PointSet(np.array(test_datapoints)))
+
+    assert layers.tolist() == [4, 3, 2, 1, 0, 0, 1, 3, 4, 5, 0, 2]
+
+
+def test_fast_non_dominated_sort_layers_are_consistent():
+    rng = np.random.default_rng(0)
+    for dim in (2, 3, 4):
+        data = rng.integers(0, 6, size=(150, dim)).astype(float)
+        layers = fast_non_dominated_sort(PointSet(data))
+
+        dominates = np.all(data[:, None] <= data[None], axis=2) & np.any(
+            data[:, None] < data[None], axis=2
+        )
+        for i in range(len(data)):
+            dominators = layers[dominates[:, i]]
+            # dominated by something from every lower layer and by nothing from its own
+            assert np.all(dominators < layers[i])
+            assert set(range(layers[i])) <= set(dominators.tolist())
+
+
+def test_3d_sweep_matches_deb_sort():
+    rng = np.random.default_rng(1)
+    data = rng.random((400, 3))
+    # half of the rows on a plane, so the first layers are large
+    data[::2, 2] = 2 - data[::2, 0] - data[::2, 1]
+    rows = np.unique(data, axis=0)
+
+    assert np.array_equal(_sort_3d(rows), _deb_sort(rows))
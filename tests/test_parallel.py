@@ -0,0 +1,44 @@
+import numpy as np
+from app.algorithms.parallel import parallel_front, parallelize, PARTITIONINGS
+from app.algorithms.filtered import naive_with_filtering
+from app.algorithms.point import Point, create_points_from_datapoints
+
+
+def test_parallelize():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    points = create_points_from_datapoints(test_datapoints)
+    non_dominated_points = parallelize("filtered naive", workers=2)(points)
+    expected_non_dominated_points = [
+        Point(np.array([3, 3])),
+        Point(np.array([4, 1])),
+        Point(np.array([1, 8])),
+    ]
+
+    assert all(p in non_dominated_points for p in expected_non_dominated_points)
+    assert all(p in expected_non_dominated_points for p in non_dominated_points)
+
+
+def test_parallel_front_partitionings():
+    rng = np.random.default_rng(0)
+    data = np.round(rng.normal(size=(400, 3)), 1)
+    expected = {tuple(p.x) for p in naive_with_filtering(create_points_from_datapoints(data))}
+
+    for partitioning in PARTITIONINGS:
+        indices = parallel_front(data, "ideal point method", 3, partitioning, seed=0)
+        rows = [tuple(row) for row in data[indices]]
+        assert len(rows) == len(set(rows))
+        assert set(rows) == expected
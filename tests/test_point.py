@@ -0,0 +1,50 @@
+import threading
+import numpy as np
+from app.algorithms.point import ComparisonStats, Point, current_comparison_stats
+
+
+def test_point_has_no_instance_dict():
+    assert not hasattr(Point(np.array([1, 2])), "__dict__")
+
+
+def test_comparisons_are_counted_only_within_stats_block():
+    p, q = Point(np.array([1, 2, 3])), Point(np.array([1, 5, 2]))
+
+    assert not p <= q
+    assert current_comparison_stats() is None
+
+    with ComparisonStats() as stats:
+        assert not p <= q
+        assert p == p
+        assert not p >= q
+
+    assert stats.point_comparisons == 3
+    assert stats.coordinate_comparisons == 3 + 1 + 2
+
+    assert p <= Point(np.array([1, 2, 3]))
+    assert stats.point_comparisons == 3
+
+
+def test_nested_and_threaded_stats_are_independent():
+    p, q = Point(np.array([1, 2])), Point(np.array([2, 1]))
+    thread_stats = []
+
+    def compare(times: int) -> None:
+        with ComparisonStats() as stats:
+            for _ in range(times):
+                p <= q
+        thread_stats.append(stats)
+
+    with ComparisonStats() as outer:
+        p <= q
+        with ComparisonStats() as inner:
+            p <= q
+            threads = [threading.Thread(target=compare, args=(n,)) for n in (10, 20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+    assert sorted(s.point_comparisons for s in thread_stats) == [10, 20]
+    assert inner.point_comparisons == 1
+    assert outer.point_comparisons == 2
@@ -0,0 +1,50 @@
+import numpy as np
+from app.algorithms.point_set import PointSet
+from app.algorithms.filtered import naive_with_filtering, block_naive_with_filtering
+from app.algorithms.ideal_point import block_ideal_point_method
+from app.algorithms.naive_without_filtration import block_naive_without_filtering
+from app.algorithms.point import create_points_from_datapoints
+
+BLOCK_ALGORITHMS = [
+    block_naive_with_filtering,
+    block_naive_without_filtering,
+    block_ideal_point_method,
+]
+
+
+def test_block_algorithms():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    points = PointSet(np.array(test_datapoints))
+    expected_non_dominated_indices = {4, 5, 10}
+
+    for algorithm in BLOCK_ALGORITHMS:
+        for block_size in (1, 3, 64):
+            non_dominated_indices = algorithm(points, block_size=block_size)
+            assert set(non_dominated_indices.tolist()) == expected_non_dominated_indices
+
+
+def test_block_algorithms_match_naive_with_filtering():
+    rng = np.random.default_rng(0)
+    # rounding produces duplicated rows, only one copy of each may survive
+    data = np.round(rng.normal(size=(300, 3)), 1)
+    expected = {tuple(p.x) for p in naive_with_filtering(create_points_from_datapoints(data))}
+
+    for algorithm in BLOCK_ALGORITHMS:
+        non_dominated_indices = algorithm(PointSet(data), block_size=32)
+        rows = [tuple(row) for row in data[non_dominated_indices]]
+        assert len(rows) == len(set(rows))
+        assert set(rows) == expected
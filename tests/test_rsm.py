@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from app.algorithms.point import create_points_from_datapoints
+from app.algorithms.rsm import reference_set_method
+
+
+def test_scores_of_the_example_workbook():
+    alternatives = pd.read_excel("datasets/Example.xlsx", sheet_name=0)
+    classes = pd.read_excel("datasets/Example.xlsx", sheet_name=1)
+    data = alternatives[["x", "y", "z"]].to_numpy(dtype=float)
+    class_data = classes[["x", "y", "z"]].to_numpy(dtype=float)
+
+    indices, scores = reference_set_method(
+        create_points_from_datapoints(data),
+        np.array([0.5, 0.3, 0.2]),
+        ideal_points_set=class_data[:1],
+        status_quo_points_set=class_data[1:],
+    )
+
+    assert indices == [1, 2, 3, 0]
+    assert np.allclose(
+        scores,
+        [
+            0.4337568047787956,
+            0.43337349869145997,
+            0.4309168697438596,
+            0.43008888908549686,
+        ],
+    )
+
+
+def test_blocks_match_a_single_pass():
+    rng = np.random.default_rng(0)
+    data = rng.random((500, 3))
+    ideal, status_quo = rng.random((40, 3)), rng.random((30, 3))
+    weights = np.array([0.2, 0.3, 0.5])
+
+    # a small memory limit forces blocks of a few rows
+    blocked = reference_set_method(data, weights, ideal, status_quo, memory_limit=4096)
+    single = reference_set_method(data, weights, ideal, status_quo, memory_limit=2**30)
+
+    assert blocked[0] == single[0]
+    assert np.allclose(blocked[1], single[1])
+
+
+def test_constant_column_doesnt_produce_nan_scores():
+    data = np.array([[0.0, 1.0], [1.0, 1.0], [0.5, 1.0]])
+
+    indices, scores = reference_set_method(
+        data, np.array([0.5, 0.5]), np.array([[0.0, 0.0]]), np.array([[1.0, 1.0]])
+    )
+
+    assert not np.any(np.isnan(scores))
+    assert indices == [1, 2, 0]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from app.algorithms.sensitivity import rank_acceptability, sample_weights
+
+
+def test_rank_acceptability_is_a_distribution_over_ranks():
+    data = np.random.default_rng(0).random((12, 3))
+
+    acceptability = rank_acceptability(data, "TOPSIS", samples=500, batch_size=128)
+
+    assert acceptability.shape == (12, 12)
+    assert np.allclose(acceptability.sum(axis=0), 1)
+    assert np.allclose(acceptability.sum(axis=1), 1)
+
+
+@pytest.mark.parametrize("method", ["TOPSIS", "UTA Star"])
+def test_rank_acceptability_depends_only_on_the_seed(method):
+    data = np.random.default_rng(1).random((8, 3))
+
+    sequential = rank_acceptability(data, method, samples=300, seed=5, batch_size=64)
+    parallel = rank_acceptability(
+        data, method, samples=300, seed=5, batch_size=64, workers=2
+    )
+
+    assert np.array_equal(sequential, parallel)
+
+
+def test_extreme_alternatives_keep_their_ranks_for_every_weight():
+    data = np.array([[0.0, 0.0], [0.5, 0.2], [0.2, 0.6], [1.0, 1.0]])
+
+    acceptability = rank_acceptability(data, "VIKOR", samples=200)
+
+    assert acceptability[3, 0] == 1
+    assert acceptability[0, 3] == 1
+
+
+def test_box_weights_stay_within_bounds():
+    lower, upper = np.array([0.1, 0.3]), np.array([0.2, 0.5])
+
+    weights = sample_weights(1000, 2, np.random.default_rng(0), (lower, upper))
+
+    assert np.all((weights >= lower) & (weights <= upper))
+
+
+def test_uta_star_options_of_the_single_vector_method():
+    data = np.random.default_rng(2).random((6, 2))
+    options = {
+        "breakpoint_counts": 3,
+        "preferred_points_set": data[:1],
+        "non_preferred_points_set": data[-1:],
+    }
+
+    acceptability = rank_acceptability(data, "UTA Star", samples=20, options=options)
+
+    # fitted utilities don't use the weights, every sample gives the same ranking
+    assert set(np.unique(acceptability)) == {0.0, 1.0}
@@ -0,0 +1,32 @@
+import numpy as np
+from app.algorithms.sfs import sort_filter_skyline, PRESORT_FUNCTIONS
+from app.algorithms.point import Point, create_points_from_datapoints
+
+
+def test_sort_filter_skyline():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    points = create_points_from_datapoints(test_datapoints)
+    expected_non_dominated_points = [
+        Point(np.array([3, 3])),
+        Point(np.array([4, 1])),
+        Point(np.array([1, 8])),
+    ]
+
+    for presort in PRESORT_FUNCTIONS:
+        non_dominated_points = sort_filter_skyline(points, presort)
+        assert all(p in non_dominated_points for p in expected_non_dominated_points)
+        assert all(p in expected_non_dominated_points for p in non_dominated_points)
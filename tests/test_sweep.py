@@ -0,0 +1,41 @@
+import numpy as np
+from app.algorithms.sweep import sweep_2d, sweep_3d
+from app.algorithms.point_set import PointSet
+from app.algorithms.filtered import naive_with_filtering
+from app.algorithms.point import create_points_from_datapoints
+
+
+def test_sweep_2d():
+    test_datapoints = [
+        (5, 5),
+        (3, 6),
+        (4, 4),
+        (5, 3),
+        (3, 3),
+        (1, 8),
+        (3, 4),
+        (4, 5),
+        (3, 10),
+        (6, 6),
+        (4, 1),
+        (3, 5),
+    ]
+
+    non_dominated_indices = sweep_2d(PointSet(np.array(test_datapoints)))
+
+    assert set(non_dominated_indices.tolist()) == {4, 5, 10}
+
+
+def test_sweeps_match_naive_with_filtering():
+    rng = np.random.default_rng(0)
+    for dim, sweep in ((2, sweep_2d), (3, sweep_3d)):
+        # integer coordinates produce ties and duplicated rows
+        data = rng.integers(0, 8, size=(400, dim)).astype(float)
+        expected = {
+            tuple(p.x) for p in naive_with_filtering(create_points_from_datapoints(data))
+        }
+
+        rows = [tuple(row) for row in data[sweep(PointSet(data))]]
+
+        assert len(rows) == len(set(rows))
+        assert set(rows) == expected
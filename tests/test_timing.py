@@ -0,0 +1,21 @@
+from app.components.timing import Timeline, span
+
+
+def test_spans_are_recorded_only_within_enabled_timeline():
+    with span("outside"):
+        pass
+    with Timeline(enabled=False) as disabled:
+        with span("disabled"):
+            pass
+
+    with Timeline() as timeline:
+        with span("solve"):
+            with span("algorithm"):
+                pass
+        with span("figure"):
+            pass
+
+    assert disabled.stages == []
+    stages = [stage["stage"] for stage in timeline.breakdown()]
+    assert stages == ["solve", "solve / algorithm", "figure"]
+    assert sum(duration for _, duration in timeline.stages[::2]) <= timeline.total
@@ -0,0 +1,29 @@
+import numpy as np
+from app.algorithms.topsis import topsis, topsis_batch
+from app.algorithms.point import create_points_from_datapoints
+
+
+def test_topsis_batch_matches_single_weight_vectors():
+    rng = np.random.default_rng(0)
+    data = rng.random((40, 3))
+    points = create_points_from_datapoints(data)
+    weight_matrix = rng.dirichlet(np.ones(3), size=25)
+
+    # a small memory limit forces several chunks
+    rankings, scores = topsis_batch(points, weight_matrix, memory_limit=4096)
+
+    assert rankings.shape == scores.shape == (25, 40)
+    for weights, ranking, row_scores in zip(weight_matrix, rankings, scores):
+        indices, sorted_scores = topsis(points, weights)
+        assert ranking.tolist() == indices
+        assert np.allclose(row_scores[indices], sorted_scores)
+
+
+def test_zero_column_doesnt_produce_nan_scores():
+    data = np.array([[0.0, 0.0], [1.0, 0.0], [0.5, 0.0]])
+    weights = np.array([[0.5, 0.5], [0.2, 0.8]])
+
+    rankings, scores = topsis_batch(data, weights)
+
+    assert not np.any(np.isnan(scores))
+    assert rankings[0].tolist() == topsis(data, weights[0])[0] == [1, 2, 0]
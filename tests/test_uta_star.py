@@ -0,0 +1,125 @@
+import numpy as np
+from app.algorithms.interface import NAIVE_ALGORITHMS
+from app.algorithms.point import create_points_from_datapoints
+from app.algorithms.uta_star import (
+    criterion_breakpoints,
+    fit_marginal_utilities,
+    marginal_utility_matrix,
+    uta_star,
+    uta_star_batch,
+)
+from app.components.dataset_loader import ExcelDatasetLoader
+from app.components.model import Model
+from app.components.ranking_action_menu import build_uta_star, rsm_reference_sets
+
+
+def test_two_breakpoints_rank_by_weighted_min_max_scaling():
+    data = np.random.default_rng(0).random((50, 3))
+    weights = [0.2, 0.5, 0.3]
+
+    indices, scores = uta_star(create_points_from_datapoints(data), weights)
+
+    # criteria are minimised, the lowest value of a criterion gets its whole weight
+    expected = ((data.max(axis=0) - data) / np.ptp(data, axis=0)) @ weights
+    assert indices == np.argsort(-expected, kind="stable").tolist()
+    assert np.allclose(scores, expected[indices])
+
+
+def test_constant_criterion_contributes_nothing():
+    data = np.array([[0.0, 1.0], [1.0, 1.0], [0.5, 1.0]])
+
+    indices, scores = uta_star(data, [0.5, 0.5], breakpoint_counts=[3, 4])
+
+    assert indices == [0, 2, 1]
+    assert np.allclose(scores, [0.5, 0.25, 0.0])
+
+
+def test_fitted_utilities_prefer_the_first_reference_set():
+    rng = np.random.default_rng(1)
+    data = rng.random((100, 3))
+    # criteria are minimised, the preferred set is lower on the first one
+    preferred = rng.random((4, 3)) * 0.2 + [0.0, 0.8, 0.4]
+    non_preferred = rng.random((4, 3)) * 0.2 + [0.8, 0.0, 0.4]
+
+    indices, scores = uta_star(
+        np.vstack([data, preferred, non_preferred]),
+        None,
+        breakpoint_counts=4,
+        preferred_points_set=preferred,
+        non_preferred_points_set=non_preferred,
+    )
+
+    position = {index: rank for rank, index in enumerate(indices)}
+    assert max(position[i] for i in range(100, 104)) < min(
+        position[i] for i in range(104, 108)
+    )
+    # increments of the fitted utilities sum up to 1
+    assert max(scores) <= 1 + 1e-9
+
+
+def test_uta_star_batch_matches_single_weight_vectors():
+    rng = np.random.default_rng(2)
+    data = rng.random((60, 4))
+    weight_matrix = rng.dirichlet(np.ones(4), size=20)
+
+    rankings, scores = uta_star_batch(data, weight_matrix, 3, memory_limit=4096)
+
+    for weights, ranking, row_scores in zip(weight_matrix, rankings, scores):
+        indices, sorted_scores = uta_star(data, weights, 3)
+        assert ranking.tolist() == indices
+        assert np.allclose(row_scores[indices], sorted_scores)
+
+
+def test_fit_on_the_example_workbook_prefers_the_a1_class():
+    model = Model("test-uta-star-model")
+    loader = ExcelDatasetLoader()
+    loader.read("datasets/Example.xlsx")
+    loader.populate_model(model)
+    # flipped criteria have to be flipped in the class rows as well
+    model.directions = ["Min", "Max", "Min"]
+    reference_sets = rsm_reference_sets(model)
+
+    breakpoints = criterion_breakpoints(model.signed_data, 3)
+    utilities = fit_marginal_utilities(
+        breakpoints,
+        reference_sets["ideal_points_set"],
+        reference_sets["status_quo_points_set"],
+    )
+
+    ideal, status_quo = (
+        marginal_utility_matrix(rows, breakpoints, utilities).sum(axis=1)
+        for rows in reference_sets.values()
+    )
+    assert ideal.min() > status_quo.max()
+    model.process_points_with_naive_algorithm(NAIVE_ALGORITHMS["filtered naive"])
+    model.process_points_with_ranking_method(build_uta_star(model, 3, True))
+    assert sorted(model.ranking[0]) == np.flatnonzero(model.non_dominated_mask).tolist()
+
+
+def test_dominating_row_ranks_first_with_and_without_fitting():
+    data = np.array([[0.0, 0.0], [1.0, 1.0], [0.5, 0.5], [0.2, 0.8]])
+
+    linear, _ = uta_star(data, [0.5, 0.5])
+    fitted, _ = uta_star(
+        data,
+        [0.5, 0.5],
+        preferred_points_set=data[[0, 3]],
+        non_preferred_points_set=data[[1]],
+    )
+
+    assert linear[0] == fitted[0] == 0
+    assert linear[-1] == fitted[-1] == 1
+
+
+def test_fit_handles_large_reference_sets():
+    rng = np.random.default_rng(3)
+    data = rng.random((50, 3))
+    preferred = rng.random((300, 3)) * 0.5
+    non_preferred = rng.random((300, 3)) * 0.5 + 0.5
+
+    utilities = fit_marginal_utilities(
+        criterion_breakpoints(data, 4), preferred, non_preferred
+    )
+
+    assert all(np.all(np.diff(values) <= 0) for values in utilities)
+    assert np.isclose(sum(values[0] for values in utilities), 1)